@@ -4,8 +4,12 @@ PyInstaller 빌드 스크립트
 """
 import os
 import sys
+import errno
+import ctypes
 import shutil
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -33,7 +37,9 @@ def install_pyinstaller():
     except ImportError:
         print("PyInstaller를 설치합니다...")
         try:
-            subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'pyinstaller'])
+            # pefile 2024.8.26은 바이너리 분류 단계가 매우 느려 제외
+            subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'pyinstaller',
+                                   'pefile!=2024.8.26'])
             print("PyInstaller 설치 완료")
             return True
         except subprocess.CalledProcessError as e:
@@ -102,31 +108,97 @@ exe = EXE(
     print("PyInstaller spec 파일 생성 완료: app.spec")
 
 
-def build_executable():
-    """실행 파일 빌드"""
+def _run_pyinstaller(spec, index):
+    """spec 파일 하나를 빌드하고 종료 코드 반환 (출력은 줄 단위로 바로 표시)"""
+    env = os.environ.copy()
+    env['PYINSTALLER_CONFIG_DIR'] = os.path.join(tempfile.gettempdir(), f'pyi-{os.getpid()}-{index}')
+
+    cmd = [sys.executable, '-m', 'PyInstaller', '--clean', spec]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                            bufsize=1, text=True, env=env)
+    # 병렬 빌드 시 출력이 섞이므로 spec 이름을 앞에 붙임
+    for line in proc.stdout:
+        print(f"[{spec}] {line}", end='')
+    return proc.wait()
+
+
+def build_executable(specs=None):
+    """실행 파일 빌드 (spec이 여러 개면 병렬로 빌드)"""
+    specs = specs or ['app.spec']
+
     try:
         print("실행 파일 빌드를 시작합니다...")
 
-        # PyInstaller 실행
-        cmd = [sys.executable, '-m', 'PyInstaller', '--clean', 'app.spec']
+        # PyInstaller 실행 (spec별로 별도 프로세스)
+        with ThreadPoolExecutor(max_workers=len(specs)) as executor:
+            results = list(executor.map(_run_pyinstaller, specs, range(len(specs))))
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        failed = False
+        for spec, returncode in zip(specs, results):
+            if returncode != 0:
+                failed = True
+                print(f"빌드 실패: {spec} (종료 코드 {returncode})")
 
-        if result.returncode == 0:
-            print("빌드 성공!")
-            print("실행 파일 위치: dist/VirtualDesktopMonitorControl.exe")
-            return True
-        else:
-            print("빌드 실패:")
-            print(result.stdout)
-            print(result.stderr)
+        if failed:
             return False
 
+        print("빌드 성공!")
+        print("실행 파일 위치: dist/VirtualDesktopMonitorControl.exe")
+        return True
+
     except Exception as e:
         print(f"빌드 중 오류 발생: {e}")
         return False
 
 
+# reflink/clonefile을 지원하지 않을 때 일반 복사로 대체할 오류 코드
+_CLONE_FALLBACK_ERRNOS = {errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV,
+                          errno.ENOSYS, errno.EINVAL, errno.EEXIST}
+
+
+def _clone_file(src, dst):
+    """파일 복사 (CoW 파일시스템에서는 reflink/clonefile 우선 시도)"""
+    try:
+        if sys.platform == 'darwin':
+            libc = ctypes.CDLL('/usr/lib/libc.dylib', use_errno=True)
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return dst
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+        if hasattr(os, 'copy_file_range'):
+            # Linux: CoW 파일시스템(XFS, Btrfs)에서는 커널이 reflink로 처리
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src, dst)
+            return dst
+
+    except OSError as e:
+        if e.errno not in _CLONE_FALLBACK_ERRNOS:
+            raise
+
+    return shutil.copy2(src, dst)
+
+
+def _fast_copytree(src, dst):
+    """디렉토리 트리 복사 (Windows에서는 robocopy 멀티스레드 복사 사용)"""
+    if sys.platform == 'win32' and shutil.which('robocopy'):
+        cmd = ['robocopy', str(src), str(dst), '/E', '/MT:16',
+               '/NFL', '/NDL', '/NJH', '/NJS', '/NP']
+        result = subprocess.run(cmd)
+        # robocopy 반환 코드는 8 미만이면 성공 (0: 변경 없음, 1: 복사됨, 2/3: 추가 파일 존재)
+        if result.returncode < 8:
+            return
+        print(f"robocopy 실패 (코드: {result.returncode}), 기본 복사로 대체합니다.")
+
+    shutil.copytree(src, dst, dirs_exist_ok=True, copy_function=_clone_file)
+
+
 def copy_resources():
     """필요한 리소스 파일 복사"""
     dist_dir = Path('dist')
@@ -136,7 +208,7 @@ def copy_resources():
 
     # config 디렉토리가 있다면 복사
     if Path('config').exists():
-        shutil.copytree('config', dist_dir / 'config', dirs_exist_ok=True)
+        _fast_copytree('config', dist_dir / 'config')
         print("config 디렉토리 복사 완료")
 
     # README 파일 생성
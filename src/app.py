@@ -1,14 +1,15 @@
 """
 메인 애플리케이션 클래스
 """
-import threading
-import time
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from .config_manager import ConfigManager
-from .virtual_desktop_controller import VirtualDesktopController
-from .system_tray import SystemTrayIcon, SettingsDialog, WindowManagementDialog
 from .logger import get_logger_manager, get_logger
 
+if TYPE_CHECKING:
+    # GUI/Win32 모듈은 실제 사용 시점에 지연 임포트 (시작 시간 단축)
+    from .virtual_desktop_controller import VirtualDesktopController
+    from .system_tray import SystemTrayIcon, SettingsDialog, WindowManagementDialog
+
 
 class VirtualDesktopApp:
     """메인 애플리케이션 클래스"""
@@ -20,10 +21,10 @@ class VirtualDesktopApp:
 
         # 컴포넌트 초기화
         self.config_manager = ConfigManager()
-        self.controller: Optional[VirtualDesktopController] = None
-        self.tray_icon: Optional[SystemTrayIcon] = None
-        self.settings_dialog: Optional[SettingsDialog] = None
-        self.window_dialog: Optional[WindowManagementDialog] = None
+        self.controller: Optional['VirtualDesktopController'] = None
+        self.tray_icon: Optional['SystemTrayIcon'] = None
+        self.settings_dialog: Optional['SettingsDialog'] = None
+        self.window_dialog: Optional['WindowManagementDialog'] = None
 
         self._running = False
 
@@ -41,8 +42,10 @@ class VirtualDesktopApp:
             self.logger_manager.set_log_level(config.log_level)
 
             # 컨트롤러 초기화
+            from .virtual_desktop_controller import VirtualDesktopController
             self.controller = VirtualDesktopController(
-                target_monitor_index=config.target_monitor_index
+                target_monitor_index=config.target_monitor_index,
+                hotkey_enabled=config.hotkey_enabled
             )
 
             self.logger.info(f"초기 설정 로드 완료 - 대상 모니터: {config.target_monitor_index}")
@@ -60,6 +63,7 @@ class VirtualDesktopApp:
             self.logger_manager.log_system_info()
 
             # 트레이 아이콘 초기화
+            from .system_tray import SystemTrayIcon, SettingsDialog, WindowManagementDialog
             self.tray_icon = SystemTrayIcon()
             self.tray_icon.set_callbacks(
                 toggle_callback=self._on_toggle,
@@ -183,6 +187,10 @@ class VirtualDesktopApp:
             if 'target_monitor_index' in new_config and self.controller:
                 self.controller.set_target_monitor(new_config['target_monitor_index'])
 
+            # 핫키 사용 여부 변경 적용
+            if 'hotkey_enabled' in new_config and self.controller:
+                self.controller.set_hotkey_enabled(new_config['hotkey_enabled'])
+
             self.logger.info("설정 변경 적용 완료")
 
         except Exception as e:
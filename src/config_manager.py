@@ -3,10 +3,37 @@
 """
 import json
 import os
+import threading
 from pathlib import Path
 from typing import Dict, Any, Optional
 from .models import AppConfig
 from .logger import get_logger
+from .error_handler import get_resource_manager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 설정 변경 후 파일 기록까지 대기 시간 (초) - 연속 변경을 한 번의 쓰기로 병합
+FLUSH_DELAY = 0.5
+
+# update_config로 변경 가능한 설정 필드
+_VALID_FIELDS = frozenset({'enabled', 'target_monitor_index', 'hotkey_enabled',
+                           'log_level', 'auto_start', 'window_filters'})
+
+
+def write_json_atomic(path: Path, data: dict) -> None:
+    """JSON 파일 저장 (orjson 우선 사용, 임시 파일 기록 후 교체)"""
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # 임시 파일에 기록 후 교체 (기록 중 종료되어도 기존 파일 보존)
+    tmp_file = path.with_suffix('.json.tmp')
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, path)
 
 
 class ConfigManager:
@@ -21,8 +48,17 @@ class ConfigManager:
         self.config_dir.mkdir(exist_ok=True)
 
         self._config: Optional[AppConfig] = None
+
+        # 지연 저장 상태
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._write_timer: Optional[threading.Timer] = None
+
         self.load_config()
 
+        # 종료 시 대기 중인 변경 사항 강제 저장
+        get_resource_manager().register_cleanup(self._flush, "ConfigManager.flush")
+
     def load_config(self) -> AppConfig:
         """설정 파일 로드"""
         try:
@@ -38,7 +74,7 @@ class ConfigManager:
                 self.logger.info("기본 설정 생성 완료")
 
         except Exception as e:
-            self.logger.error(f"설정 로드 실패: {str(e)}")
+            self.logger.error("설정 로드 실패: %s", e)
             self._config = AppConfig()
 
         return self._config
@@ -49,14 +85,13 @@ class ConfigManager:
             if self._config is None:
                 return False
 
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self._config.to_dict(), f, indent=2, ensure_ascii=False)
+            write_json_atomic(self.config_file, self._config.to_dict())
 
             self.logger.info("설정 파일 저장 완료")
             return True
 
         except Exception as e:
-            self.logger.error(f"설정 저장 실패: {str(e)}")
+            self.logger.error("설정 저장 실패: %s", e)
             return False
 
     def get_config(self) -> AppConfig:
@@ -71,26 +106,49 @@ class ConfigManager:
             if self._config is None:
                 self.load_config()
 
-            # 유효한 필드만 업데이트
-            valid_fields = ['enabled', 'target_monitor_index', 'hotkey_enabled',
-                          'log_level', 'auto_start', 'window_filters']
-
+            # 유효한 필드 중 값이 바뀐 것만 업데이트
             updated = False
             for key, value in kwargs.items():
-                if key in valid_fields:
-                    setattr(self._config, key, value)
-                    updated = True
-                    self.logger.debug(f"설정 업데이트: {key} = {value}")
+                if key not in _VALID_FIELDS:
+                    continue
+                if getattr(self._config, key) == value:
+                    continue
+                setattr(self._config, key, value)
+                updated = True
+                self.logger.debug("설정 업데이트: %s = %s", key, value)
 
             if updated:
-                return self.save_config()
+                self._dirty = True
+                self._schedule_flush()
 
             return True
 
         except Exception as e:
-            self.logger.error(f"설정 업데이트 실패: {str(e)}")
+            self.logger.error("설정 업데이트 실패: %s", e)
             return False
 
+    def _schedule_flush(self) -> None:
+        """지연 저장 예약 (대기 중인 예약은 취소 후 재설정)"""
+        with self._lock:
+            if self._write_timer:
+                self._write_timer.cancel()
+            self._write_timer = threading.Timer(FLUSH_DELAY, self._flush)
+            self._write_timer.daemon = True
+            self._write_timer.start()
+
+    def _flush(self) -> None:
+        """대기 중인 설정 변경을 파일에 기록"""
+        with self._lock:
+            if self._write_timer:
+                self._write_timer.cancel()
+                self._write_timer = None
+
+            if not self._dirty:
+                return
+
+            self._dirty = False
+            self.save_config()
+
     def reset_to_default(self) -> bool:
         """기본 설정으로 초기화"""
         try:
@@ -99,7 +157,7 @@ class ConfigManager:
             self.logger.info("설정을 기본값으로 초기화")
             return result
         except Exception as e:
-            self.logger.error(f"설정 초기화 실패: {str(e)}")
+            self.logger.error("설정 초기화 실패: %s", e)
             return False
 
     def get_config_summary(self) -> Dict[str, Any]:
@@ -1,9 +1,10 @@
 """
 전역 예외 처리 및 안정성 강화
 """
+import os
 import sys
-import traceback
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Callable
 from .logger import get_logger
 
@@ -40,10 +41,10 @@ class GlobalExceptionHandler:
             return
 
         # 치명적 오류 로깅
-        error_msg = f"치명적 오류 발생: {exc_type.__name__}: {exc_value}"
-        self.logger.critical(error_msg, exc_info=True)
+        self.logger.critical("치명적 오류 발생: %s: %s", exc_type.__name__, exc_value, exc_info=True)
 
-        # 트레이스백 정보 로깅
+        # 트레이스백 정보 로깅 (크래시 경로에서만 사용하므로 지연 임포트)
+        import traceback
         tb_lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
         for line in tb_lines:
             self.logger.critical(line.rstrip())
@@ -53,7 +54,7 @@ class GlobalExceptionHandler:
             try:
                 self._crash_callback(exc_type, exc_value, exc_traceback)
             except Exception as e:
-                self.logger.error(f"크래시 콜백 실행 중 오류: {str(e)}")
+                self.logger.error("크래시 콜백 실행 중 오류: %s", e)
 
         # 원래 예외 처리기 호출
         self._original_excepthook(exc_type, exc_value, exc_traceback)
@@ -62,8 +63,8 @@ class GlobalExceptionHandler:
         """스레드 예외 처리"""
         exc_type, exc_value, exc_traceback, thread = args
 
-        error_msg = f"스레드 '{thread.name}'에서 예외 발생: {exc_type.__name__}: {exc_value}"
-        self.logger.error(error_msg, exc_info=(exc_type, exc_value, exc_traceback))
+        self.logger.error("스레드 '%s'에서 예외 발생: %s: %s", thread.name, exc_type.__name__, exc_value,
+                          exc_info=(exc_type, exc_value, exc_traceback))
 
 
 class SafeExecutor:
@@ -126,22 +127,28 @@ def uninstall_global_exception_handler() -> None:
 class ResourceManager:
     """리소스 정리 및 메모리 관리 클래스"""
 
+    # 병렬 정리 작업자 수
+    CLEANUP_WORKERS = 4
+
     def __init__(self):
         self.logger = get_logger("ResourceManager")
         self._cleanup_callbacks = []
         self._resources = {}
 
-    def register_cleanup(self, callback: Callable, name: str = None) -> None:
-        """정리 콜백 등록"""
+    def register_cleanup(self, callback: Callable, name: str = None,
+                         depends_on: Optional[str] = None) -> None:
+        """정리 콜백 등록 (depends_on: 먼저 정리되어야 하는 콜백 이름)"""
         callback_name = name or callback.__name__
-        self._cleanup_callbacks.append((callback_name, callback))
+        self._cleanup_callbacks.append((callback_name, depends_on, callback))
         self.logger.debug(f"정리 콜백 등록: {callback_name}")
 
-    def register_resource(self, name: str, resource, cleanup_func: Callable = None) -> None:
-        """리소스 등록"""
+    def register_resource(self, name: str, resource, cleanup_func: Callable = None,
+                          depends_on: Optional[str] = None) -> None:
+        """리소스 등록 (depends_on: 먼저 정리되어야 하는 리소스 이름)"""
         self._resources[name] = {
             'resource': resource,
-            'cleanup_func': cleanup_func
+            'cleanup_func': cleanup_func,
+            'depends_on': depends_on
         }
         self.logger.debug(f"리소스 등록: {name}")
 
@@ -149,33 +156,21 @@ class ResourceManager:
         """모든 리소스 정리"""
         self.logger.info("리소스 정리 시작")
 
-        # 등록된 리소스 정리
-        for name, resource_info in self._resources.items():
-            try:
-                resource = resource_info['resource']
-                cleanup_func = resource_info['cleanup_func']
-
-                if cleanup_func:
-                    cleanup_func(resource)
-                elif hasattr(resource, 'close'):
-                    resource.close()
-                elif hasattr(resource, 'cleanup'):
-                    resource.cleanup()
-                elif hasattr(resource, 'stop'):
-                    resource.stop()
-
-                self.logger.debug(f"리소스 정리 완료: {name}")
-
-            except Exception as e:
-                self.logger.error(f"리소스 '{name}' 정리 중 오류: {str(e)}")
-
-        # 정리 콜백 실행
-        for callback_name, callback in self._cleanup_callbacks:
-            try:
-                callback()
-                self.logger.debug(f"정리 콜백 실행 완료: {callback_name}")
-            except Exception as e:
-                self.logger.error(f"정리 콜백 '{callback_name}' 실행 중 오류: {str(e)}")
+        resources = [(name, info['depends_on'], info) for name, info in self._resources.items()]
+        callbacks = [(name, depends_on, callback) for name, depends_on, callback in self._cleanup_callbacks]
+
+        if os.environ.get('VDMC_SEQ_CLEANUP') == '1':
+            # 등록 순서대로 순차 정리
+            for name, _, resource_info in resources:
+                self._cleanup_resource(name, resource_info)
+            for callback_name, _, callback in callbacks:
+                self._run_cleanup_callback(callback_name, callback)
+        else:
+            # 의존성 없는 항목끼리 병렬 정리 (리소스 -> 정리 콜백 순서는 유지)
+            with ThreadPoolExecutor(max_workers=self.CLEANUP_WORKERS,
+                                    thread_name_prefix="cleanup") as pool:
+                self._run_batches(pool, resources, self._cleanup_resource)
+                self._run_batches(pool, callbacks, self._run_cleanup_callback)
 
         # 리소스 목록 초기화
         self._resources.clear()
@@ -183,6 +178,55 @@ class ResourceManager:
 
         self.logger.info("리소스 정리 완료")
 
+    def _run_batches(self, pool: ThreadPoolExecutor, items: list, run: Callable) -> None:
+        """의존 대상이 남아있지 않은 항목을 배치로 묶어 실행"""
+        pending = items
+        while pending:
+            waiting = {name for name, _, _ in pending}
+            ready = [item for item in pending if item[1] not in waiting]
+            if not ready:
+                # 순환 의존성 - 남은 항목을 등록 순서대로 실행
+                for name, _, target in pending:
+                    run(name, target)
+                return
+
+            if len(ready) == 1:
+                # 단일 항목은 호출 스레드에서 바로 실행
+                name, _, target = ready[0]
+                run(name, target)
+            else:
+                wait([pool.submit(run, name, target) for name, _, target in ready])
+
+            pending = [item for item in pending if item[1] in waiting]
+
+    def _cleanup_resource(self, name: str, resource_info: dict) -> None:
+        """개별 리소스 정리"""
+        try:
+            resource = resource_info['resource']
+            cleanup_func = resource_info['cleanup_func']
+
+            if cleanup_func:
+                cleanup_func(resource)
+            elif hasattr(resource, 'close'):
+                resource.close()
+            elif hasattr(resource, 'cleanup'):
+                resource.cleanup()
+            elif hasattr(resource, 'stop'):
+                resource.stop()
+
+            self.logger.debug(f"리소스 정리 완료: {name}")
+
+        except Exception as e:
+            self.logger.error(f"리소스 '{name}' 정리 중 오류: {str(e)}")
+
+    def _run_cleanup_callback(self, callback_name: str, callback: Callable) -> None:
+        """개별 정리 콜백 실행"""
+        try:
+            callback()
+            self.logger.debug(f"정리 콜백 실행 완료: {callback_name}")
+        except Exception as e:
+            self.logger.error(f"정리 콜백 '{callback_name}' 실행 중 오류: {str(e)}")
+
     def get_memory_usage(self) -> dict:
         """메모리 사용량 정보 반환"""
         try:
@@ -2,10 +2,80 @@
 키보드 이벤트 감지 시스템 - 최소 기능 구현
 """
 from pynput import keyboard
+from array import array
+from collections import OrderedDict
 from typing import Callable, Optional
-import threading
+import logging
+import sys
 import time
-from .logger import get_logger
+from .logger import get_logger, get_logger_manager
+
+# 핫키 판정에 필요한 가상 키 코드 (Win, Ctrl, Alt, 방향키)
+_HOTKEY_VK_CODES = frozenset({
+    0x5B, 0x5C,        # VK_LWIN, VK_RWIN
+    0x11, 0xA2, 0xA3,  # VK_CONTROL, VK_LCONTROL, VK_RCONTROL
+    0x12, 0xA4, 0xA5,  # VK_MENU, VK_LMENU, VK_RMENU
+    0x25, 0x27, 0x28,  # VK_LEFT, VK_RIGHT, VK_DOWN
+})
+
+
+def _win32_event_filter(msg, data) -> bool:
+    """핫키와 무관한 키 이벤트는 pynput 키 변환 전에 버림 (Windows 전용)"""
+    return data.vkCode in _HOTKEY_VK_CODES
+
+
+# 눌린 키 상태 비트 (물리 키 단위 - 좌/우 수정자 키를 따로 추적)
+K_WIN_L = 1 << 0
+K_WIN_R = 1 << 1
+K_CTRL_L = 1 << 2
+K_CTRL_R = 1 << 3
+K_ALT_L = 1 << 4
+K_ALT_R = 1 << 5
+K_LEFT = 1 << 6
+K_RIGHT = 1 << 7
+K_DOWN = 1 << 8
+
+NUM_TRACKED_KEYS = 9
+
+M_ALT = K_ALT_L | K_ALT_R
+M_ARROWS = K_LEFT | K_RIGHT | K_DOWN
+
+# 좌/우 수정자 비트를 좌측 비트로 접은 뒤 비교할 조합 (_modifiers 참고)
+_LEFT_MODIFIERS = K_WIN_L | K_CTRL_L | K_ALT_L
+REQUIRED_WC = K_WIN_L | K_CTRL_L
+REQUIRED_WCA = K_WIN_L | K_CTRL_L | K_ALT_L
+
+# 핫키 판정에 쓰이는 pynput 키 이름 그룹 (intern된 문자열)
+_WIN_KEYS = frozenset(map(sys.intern, ('cmd', 'cmd_l', 'cmd_r')))
+_CTRL_KEYS = frozenset(map(sys.intern, ('ctrl', 'ctrl_l', 'ctrl_r')))
+_ALT_KEYS = frozenset(map(sys.intern, ('alt', 'alt_l', 'alt_r')))
+
+
+def _group_bits(names: frozenset, left_bit: int, right_bit: int) -> dict:
+    """수정자 키 이름 그룹을 상태 비트로 매핑 (*_r 이름만 오른쪽 키 비트)"""
+    return {name: right_bit if name.endswith('_r') else left_bit for name in names}
+
+
+# pynput 키 이름 -> 상태 비트
+_KEY_BITS = {
+    **_group_bits(_WIN_KEYS, K_WIN_L, K_WIN_R),
+    **_group_bits(_CTRL_KEYS, K_CTRL_L, K_CTRL_R),
+    **_group_bits(_ALT_KEYS, K_ALT_L, K_ALT_R),
+    'left': K_LEFT, 'right': K_RIGHT, 'down': K_DOWN,
+}
+
+
+def _modifiers(mask: int) -> int:
+    """좌/우 수정자 키 비트를 좌측 비트 하나로 합친 수정자 마스크 반환"""
+    return (mask | mask >> 1) & _LEFT_MODIFIERS
+
+
+# 키 이름 캐시 최대 크기
+_NAME_CACHE_SIZE = 256
+
+# 시간 임계값 (time.monotonic_ns 기준 정수 나노초)
+_TRIGGER_COOLDOWN_NS = 1_000_000_000  # 1초 쿨다운 (더 강력한 중복 방지)
+_KEY_REPEAT_NS = 100_000_000  # 100ms 내 같은 키 이벤트 무시
 
 
 class HotkeyListener:
@@ -13,19 +83,26 @@ class HotkeyListener:
 
     def __init__(self):
         self.logger = get_logger("HotkeyListener")
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        get_logger_manager().add_level_listener(self._refresh_debug_enabled)
         self._listener: Optional[keyboard.Listener] = None
         self._callback: Optional[Callable] = None
-        self._pressed_keys = set()
+        self._mask = 0  # 눌린 키 상태 비트마스크
         self._running = False
 
         # 중복 감지 방지
-        self._last_trigger_time = 0
-        self._trigger_cooldown = 1.0  # 1초 쿨다운 (더 강력한 중복 방지)
+        self._last_trigger_time = 0  # 마지막 핫키 실행 시각 (monotonic_ns)
         self._last_combination = None
 
-        # 키 상태 추적 (키 반복 방지)
-        self._key_states = {}  # 키별 마지막 이벤트 시간
-        self._key_repeat_threshold = 0.1  # 100ms 내 같은 키 이벤트 무시
+        # 키 상태 추적 (키 반복 방지) - 상태 비트 위치별 마지막 이벤트 시각 (monotonic_ns)
+        self._key_times = array('Q', [0]) * NUM_TRACKED_KEYS
+
+        # 키 객체 -> 키 이름 캐시
+        self._name_cache: OrderedDict = OrderedDict()
+
+    def _refresh_debug_enabled(self) -> None:
+        """로그 레벨 변경 시 DEBUG 출력 여부 캐시 갱신"""
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
 
     def set_callback(self, callback: Callable[[str], None]) -> None:
         """핫키 감지 시 호출할 콜백 함수 설정"""
@@ -39,7 +116,9 @@ class HotkeyListener:
         try:
             self._listener = keyboard.Listener(
                 on_press=self._on_key_press,
-                on_release=self._on_key_release
+                on_release=self._on_key_release,
+                win32_event_filter=_win32_event_filter,
+                suppress=False  # 키 입력을 가로채지 않음 - 핸들러는 빠르게 반환해야 함
             )
             self._listener.start()
             self._running = True
@@ -47,134 +126,126 @@ class HotkeyListener:
             return True
 
         except Exception as e:
-            self.logger.error(f"핫키 리스너 시작 실패: {str(e)}")
+            self.logger.error("핫키 리스너 시작 실패: %s", e)
             return False
 
+    def set_enabled(self, enabled: bool) -> bool:
+        """핫키 사용 여부 설정 (비활성화 시 키보드 후크 자체를 해제)"""
+        if enabled:
+            return self.start()
+
+        self.stop()
+        return True
+
     def stop(self) -> None:
         """핫키 리스닝 중지"""
         if self._listener and self._running:
             self._listener.stop()
             self._running = False
-            self._pressed_keys.clear()
-            self._key_states.clear()
+            self._mask = 0
+            self._key_times = array('Q', [0]) * NUM_TRACKED_KEYS
             self.logger.info("핫키 리스너 중지됨")
 
     def _on_key_press(self, key) -> None:
-        """키 눌림 이벤트 처리"""
-        try:
-            # 특수 키 처리
-            if hasattr(key, 'name'):
-                key_name = key.name
-            elif hasattr(key, 'vk'):
-                key_name = f'vk_{key.vk}'
-            else:
-                key_name = str(key).replace("'", "")
+        """키 눌림 이벤트 처리 (모든 키 입력마다 호출되므로 빠르게 반환)"""
+        key_name = self._key_name(key)
+        bit = _KEY_BITS.get(key_name)
+        if not bit:
+            return  # 핫키와 무관한 키
 
-            current_time = time.time()
+        current_time = time.monotonic_ns()
 
-            # 키 반복 방지 - 같은 키가 짧은 시간 내에 반복되면 무시
-            if key_name in self._key_states:
-                if current_time - self._key_states[key_name] < self._key_repeat_threshold:
-                    return  # 키 반복 무시
+        # 키 반복 방지 - 같은 키가 짧은 시간 내에 반복되면 무시
+        idx = bit.bit_length() - 1
+        if current_time - self._key_times[idx] < _KEY_REPEAT_NS:
+            return  # 키 반복 무시
 
-            self._key_states[key_name] = current_time
+        self._key_times[idx] = current_time
 
-            # 키가 이미 눌린 상태라면 무시 (키 반복 방지)
-            if key_name in self._pressed_keys:
-                return
+        # 키가 이미 눌린 상태라면 무시 (키 반복 방지)
+        if self._mask & bit:
+            return
 
-            self._pressed_keys.add(key_name)
+        self._mask |= bit
 
-            # 방향키가 새로 눌렸을 때만 핫키 조합 확인
-            if key_name in ['left', 'right', 'down']:
-                self.logger.debug(f"방향키 눌림: {key_name}, 현재 키들: {sorted(self._pressed_keys)}")
+        # 방향키가 새로 눌렸을 때만 핫키 조합 확인
+        if bit & M_ARROWS:
+            if self._debug_enabled:
+                self.logger.debug("방향키 눌림: %s, 키 마스크: %#04x", key_name, self._mask)
 
-                if self._is_target_combination():
-                    # Alt 키 확인
-                    has_alt = any(k in self._pressed_keys for k in ['alt', 'alt_l', 'alt_r'])
+            if self._is_target_combination():
+                # Win+Ctrl+Alt+Down 조합인지 확인
+                if self._mask & M_ALT and bit == K_DOWN:
+                    direction = 'alt_down'
+                else:
+                    direction = key_name  # 방금 눌린 방향키 사용
 
-                    # Win+Ctrl+Alt+Down 조합인지 확인
-                    if has_alt and key_name == 'down':
-                        direction = 'alt_down'
-                    else:
-                        direction = key_name  # 방금 눌린 방향키 사용
+                current_combination = f"win_ctrl_{direction}"
 
-                    current_combination = f"win_ctrl_{direction}"
+                # 중복 감지 방지
+                if (current_time - self._last_trigger_time > _TRIGGER_COOLDOWN_NS or
+                    current_combination != self._last_combination):
 
-                    # 중복 감지 방지
-                    if (current_time - self._last_trigger_time > self._trigger_cooldown or
-                        current_combination != self._last_combination):
-
-                        if self._callback:
+                    if self._callback:
+                        # 외부 코드는 콜백뿐이므로 예외 처리는 콜백 호출에만 적용
+                        try:
                             self._callback(direction)
+                        except Exception:
+                            self.logger.exception("핫키 콜백 실행 중 오류: %s", direction)
+                        else:
                             if direction == 'alt_down':
-                                self.logger.info(f"핫키 감지: Win+Ctrl+Alt+Down")
+                                self.logger.info("핫키 감지: Win+Ctrl+Alt+Down")
                             else:
-                                self.logger.info(f"핫키 감지: Win+Ctrl+{direction}")
-
-                        self._last_trigger_time = current_time
-                        self._last_combination = current_combination
-                    else:
-                        self.logger.debug(f"핫키 중복 감지 방지: {direction} (쿨다운 {self._trigger_cooldown}초)")
+                                self.logger.info("핫키 감지: Win+Ctrl+%s", direction)
 
-        except Exception as e:
-            self.logger.error(f"키 눌림 처리 중 오류: {str(e)}")
+                    self._last_trigger_time = current_time
+                    self._last_combination = current_combination
+                elif self._debug_enabled:
+                    self.logger.debug("핫키 중복 감지 방지: %s (쿨다운 %s초)", direction, _TRIGGER_COOLDOWN_NS / 1e9)
 
     def _on_key_release(self, key) -> None:
         """키 놓음 이벤트 처리"""
-        try:
-            if hasattr(key, 'name'):
-                key_name = key.name
-            elif hasattr(key, 'vk'):
-                key_name = f'vk_{key.vk}'
-            else:
-                key_name = str(key).replace("'", "")
-
-            self._pressed_keys.discard(key_name)
-
+        bit = _KEY_BITS.get(self._key_name(key))
+        if bit:
+            self._mask &= ~bit
             # 키 상태에서도 제거
-            if key_name in self._key_states:
-                del self._key_states[key_name]
-
-        except Exception as e:
-            self.logger.error(f"키 놓음 처리 중 오류: {str(e)}")
+            self._key_times[bit.bit_length() - 1] = 0
+
+    def _key_name(self, key) -> str:
+        """pynput 키 객체를 키 이름으로 변환 (결과 캐시)"""
+        key_name = self._name_cache.get(key)
+        if key_name is None:
+            # 특수 키 처리 (hasattr 대신 getattr 한 번으로 확인)
+            key_name = getattr(key, 'name', None)
+            if key_name is None:
+                vk = getattr(key, 'vk', None)
+                key_name = f'vk_{vk}' if vk is not None else str(key).replace("'", "")
+
+            # 이후 dict 조회가 포인터 비교로 끝나도록 intern
+            key_name = sys.intern(key_name)
+            self._name_cache[key] = key_name
+            if len(self._name_cache) > _NAME_CACHE_SIZE:
+                self._name_cache.popitem(last=False)
+
+        return key_name
 
     def _is_target_combination(self) -> bool:
         """목표 키 조합인지 확인 (Win + Ctrl + Left/Right/Down 또는 Win + Ctrl + Alt + Down)"""
-        # Windows 키 확인 (cmd 또는 cmd_l, cmd_r)
-        has_win = any(k in self._pressed_keys for k in ['cmd', 'cmd_l', 'cmd_r'])
-
-        # Ctrl 키 확인
-        has_ctrl = any(k in self._pressed_keys for k in ['ctrl', 'ctrl_l', 'ctrl_r'])
-
-        # Alt 키 확인
-        has_alt = any(k in self._pressed_keys for k in ['alt', 'alt_l', 'alt_r'])
-
-        # 방향키 확인 (정확히 하나의 방향키만)
-        has_left = 'left' in self._pressed_keys
-        has_right = 'right' in self._pressed_keys
-        has_down = 'down' in self._pressed_keys
-
-        # 방향키가 하나만 눌렸을 때만 유효
-        arrow_count = sum([has_left, has_right, has_down])
-        has_single_arrow = arrow_count == 1
+        mask = self._mask
+        modifiers = _modifiers(mask)
 
         # Win + Ctrl + Alt + Down 조합 확인
-        if has_win and has_ctrl and has_alt and has_down:
-            self.logger.debug(f"키 조합 확인: Win+Ctrl+Alt+Down")
+        if modifiers == REQUIRED_WCA and mask & K_DOWN:
+            if self._debug_enabled:
+                self.logger.debug("키 조합 확인: Win+Ctrl+Alt+Down")
             return True
 
-        # Win + Ctrl + Left/Right/Down 조합 확인 (Alt 없음)
-        result = has_win and has_ctrl and not has_alt and has_single_arrow
-
-        if result:
-            if has_left:
-                direction = 'left'
-            elif has_right:
-                direction = 'right'
-            else:
-                direction = 'down'
-            self.logger.debug(f"키 조합 확인: Win={has_win}, Ctrl={has_ctrl}, Arrow={direction}")
+        # Win + Ctrl + Left/Right/Down 조합 확인 (Alt 없음, 방향키는 정확히 하나)
+        arrows = mask & M_ARROWS
+        result = modifiers == REQUIRED_WC and arrows != 0 and arrows & (arrows - 1) == 0
+
+        if result and self._debug_enabled:
+            self.logger.debug("키 조합 확인: Win+Ctrl, 방향키 비트: %#05x", arrows)
 
         return result
 
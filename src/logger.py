@@ -3,12 +3,34 @@
 
 파일 기반 로깅 시스템과 로그 레벨별 메시지 분류 및 저장 기능을 제공합니다.
 """
+import functools
 import logging
 import logging.handlers
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
+
+
+@functools.lru_cache(maxsize=1)
+def _sys_info() -> tuple:
+    """운영체제/Python 버전 정보 (최초 호출 시 한 번만 조회)"""
+    import platform
+    import sys
+    return platform.system(), platform.release(), sys.version
+
+
+class _SharedFormatter(logging.Formatter):
+    """여러 핸들러가 같은 레코드를 출력해도 한 번만 포맷하는 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        cached = record.__dict__.get('_formatted')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+
+        text = super().format(record)
+        record._formatted = (self, text)
+        return text
 
 
 class LoggerManager:
@@ -18,6 +40,7 @@ class LoggerManager:
         self.log_dir = Path(log_dir)
         self.app_name = app_name
         self.logger = None
+        self._level_listeners = []  # 로그 레벨 변경 시 호출할 콜백
 
         # 로그 디렉토리 생성
         self.log_dir.mkdir(exist_ok=True)
@@ -35,8 +58,8 @@ class LoggerManager:
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
 
-        # 로그 포맷 설정
-        formatter = logging.Formatter(
+        # 로그 포맷 설정 (일반/에러 파일 핸들러가 포맷 결과를 공유)
+        formatter = _SharedFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
@@ -97,8 +120,15 @@ class LoggerManager:
             for handler in self.logger.handlers:
                 if isinstance(handler, logging.StreamHandler) and not isinstance(handler, logging.FileHandler):
                     handler.setLevel(level_map[level.upper()])
+
+            for listener in self._level_listeners:
+                listener()
         else:
-            self.logger.warning(f"알 수 없는 로그 레벨: {level}")
+            self.logger.warning("알 수 없는 로그 레벨: %s", level)
+
+    def add_level_listener(self, callback: Callable[[], None]) -> None:
+        """로그 레벨 변경 시 호출할 콜백 등록 (레벨 캐시 갱신용)"""
+        self._level_listeners.append(callback)
 
     def get_logger(self, name: Optional[str] = None) -> logging.Logger:
         """로거 인스턴스 반환"""
@@ -106,56 +136,63 @@ class LoggerManager:
             return logging.getLogger(f"{self.app_name}.{name}")
         return self.logger
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args) -> None:
         """디버그 메시지 로깅"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args) -> None:
         """정보 메시지 로깅"""
-        self.logger.info(message)
+        self.logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args) -> None:
         """경고 메시지 로깅"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args)
 
-    def error(self, message: str, exc_info: bool = False) -> None:
+    def error(self, message: str, *args, exc_info: bool = False) -> None:
         """오류 메시지 로깅"""
-        self.logger.error(message, exc_info=exc_info)
+        self.logger.error(message, *args, exc_info=exc_info)
 
-    def critical(self, message: str, exc_info: bool = False) -> None:
+    def critical(self, message: str, *args, exc_info: bool = False) -> None:
         """치명적 오류 메시지 로깅"""
-        self.logger.critical(message, exc_info=exc_info)
+        self.logger.critical(message, *args, exc_info=exc_info)
 
     def log_exception(self, message: str, exception: Exception) -> None:
         """예외 정보와 함께 오류 로깅"""
-        self.logger.error(f"{message}: {str(exception)}", exc_info=True)
+        self.logger.error("%s: %s", message, exception, exc_info=True)
 
     def log_system_info(self) -> None:
         """시스템 정보 로깅"""
-        import platform
-        import sys
+        system, release, version = _sys_info()
 
         self.info("=== 시스템 정보 ===")
-        self.info(f"운영체제: {platform.system()} {platform.release()}")
-        self.info(f"Python 버전: {sys.version}")
-        self.info(f"애플리케이션: {self.app_name}")
-        self.info(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self.info("운영체제: %s %s", system, release)
+        self.info("Python 버전: %s", version)
+        self.info("애플리케이션: %s", self.app_name)
+        self.info("시작 시간: %s", datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
         self.info("==================")
 
+    def _iter_log_files(self):
+        """로그 디렉토리의 로그 파일 (DirEntry, stat) 순회 - 디렉토리 한 번 읽기"""
+        # 파일 목록을 먼저 모은 뒤 반환 (순회 중 파일 삭제 가능)
+        with os.scandir(self.log_dir) as it:
+            entries = [entry for entry in it
+                       if '.log' in entry.name and entry.is_file()]
+
+        for entry in entries:
+            yield entry, entry.stat()
+
     def cleanup_old_logs(self, days: int = 30) -> None:
         """오래된 로그 파일 정리"""
         try:
             from datetime import timedelta
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            for log_file in self.log_dir.glob("*.log*"):
-                if log_file.is_file():
-                    file_time = datetime.fromtimestamp(log_file.stat().st_mtime)
-                    if file_time < cutoff_date:
-                        log_file.unlink()
-                        self.info(f"오래된 로그 파일 삭제: {log_file.name}")
+            cutoff = (datetime.now() - timedelta(days=days)).timestamp()
+
+            for entry, st in self._iter_log_files():
+                if st.st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    self.info("오래된 로그 파일 삭제: %s", entry.name)
         except Exception as e:
-            self.error(f"로그 파일 정리 중 오류: {str(e)}")
+            self.error("로그 파일 정리 중 오류: %s", e)
 
     def get_log_stats(self) -> dict:
         """로그 파일 통계 정보 반환"""
@@ -166,17 +203,15 @@ class LoggerManager:
         }
 
         try:
-            for log_file in self.log_dir.glob("*.log*"):
-                if log_file.is_file():
-                    size = log_file.stat().st_size
-                    stats['files'].append({
-                        'name': log_file.name,
-                        'size': size,
-                        'modified': datetime.fromtimestamp(log_file.stat().st_mtime).isoformat()
-                    })
-                    stats['total_size'] += size
+            for entry, st in self._iter_log_files():
+                stats['files'].append({
+                    'name': entry.name,
+                    'size': st.st_size,
+                    'modified': datetime.fromtimestamp(st.st_mtime).isoformat()
+                })
+                stats['total_size'] += st.st_size
         except Exception as e:
-            self.error(f"로그 통계 수집 중 오류: {str(e)}")
+            self.error("로그 통계 수집 중 오류: %s", e)
 
         return stats
 
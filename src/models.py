@@ -1,8 +1,9 @@
 """
 가상 데스크톱 모니터 제어 애플리케이션의 핵심 데이터 모델
 """
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Dict, List, Tuple
 from enum import Enum
 
 
@@ -14,7 +15,7 @@ class WindowState(Enum):
     HIDDEN = "hidden"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WindowInfo:
     """창 정보를 저장하는 데이터 클래스"""
     hwnd: int  # 창 핸들
@@ -28,6 +29,7 @@ class WindowInfo:
     state: WindowState  # 창 상태
     monitor_handle: int  # 모니터 핸들
     is_visible: bool  # 가시성 여부
+    cloaked: int = 0  # DWMWA_CLOAKED 값 (0: 표시, DWM_CLOAKED_SHELL: 다른 가상 데스크톱 등 셸이 숨김)
 
     def __post_init__(self):
         """초기화 후 검증"""
@@ -37,7 +39,7 @@ class WindowInfo:
             raise ValueError("창 크기는 음수일 수 없습니다")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MonitorInfo:
     """모니터 정보를 저장하는 데이터 클래스"""
     handle: int  # 모니터 핸들
@@ -85,14 +87,7 @@ class AppConfig:
 
     def to_dict(self) -> Dict:
         """딕셔너리로 변환"""
-        return {
-            "enabled": self.enabled,
-            "target_monitor_index": self.target_monitor_index,
-            "hotkey_enabled": self.hotkey_enabled,
-            "log_level": self.log_level,
-            "auto_start": self.auto_start,
-            "window_filters": self.window_filters
-        }
+        return dict(zip(_CONFIG_FIELDS, _get_config_values(self)))
 
     @classmethod
     def from_dict(cls, data: Dict) -> 'AppConfig':
@@ -104,4 +99,9 @@ class AppConfig:
             log_level=data.get("log_level", "INFO"),
             auto_start=data.get("auto_start", False),
             window_filters=data.get("window_filters", [])
-        )
\ No newline at end of file
+        )
+
+
+# AppConfig 필드 이름과 값 조회 함수 (to_dict에서 사용)
+_CONFIG_FIELDS = tuple(f.name for f in fields(AppConfig))
+_get_config_values = attrgetter(*_CONFIG_FIELDS)
\ No newline at end of file
@@ -1,10 +1,11 @@
 """
 모니터 관리 시스템 - 최소 기능 구현
 """
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 from .models import MonitorInfo
-from .windows_api import WindowsAPIWrapper
+from .windows_api import WindowsAPIWrapper, DisplayChangeListener
 from .logger import get_logger
+from .error_handler import get_resource_manager
 
 
 class MonitorManager:
@@ -13,36 +14,59 @@ class MonitorManager:
     def __init__(self):
         self.logger = get_logger("MonitorManager")
         self.api = WindowsAPIWrapper()
-        self._monitors: List[MonitorInfo] = []
+        self._monitors: Tuple[MonitorInfo, ...] = ()
+        self._primary: Optional[MonitorInfo] = None
+        self._secondary: Tuple[MonitorInfo, ...] = ()
+        self._change_listeners: List[Callable[[], None]] = []  # 모니터 구성 변경 시 호출할 콜백
         self.refresh_monitors()
 
+        # 모니터 구성이 바뀔 때만 다시 조회 (조회 결과는 그때까지 캐시)
+        self._display_listener = DisplayChangeListener(self._on_display_change, name="MonitorManager")
+        if self._display_listener.start():
+            get_resource_manager().register_cleanup(self._display_listener.stop, "MonitorManager.display_listener")
+
+    def _on_display_change(self) -> None:
+        """디스플레이 구성 변경 처리 (메시지 창 스레드)"""
+        self.logger.info("디스플레이 구성 변경 감지 - 모니터 정보 새로고침")
+        if self.refresh_monitors():
+            for listener in self._change_listeners:
+                try:
+                    listener()
+                except Exception as e:
+                    self.logger.error("모니터 변경 콜백 실행 중 오류: %s", e)
+
+    def add_change_listener(self, callback: Callable[[], None]) -> None:
+        """모니터 구성 변경(새로고침 완료) 시 호출할 콜백 등록 (메시지 창 스레드에서 호출)"""
+        self._change_listeners.append(callback)
+
     def refresh_monitors(self) -> bool:
         """모니터 정보를 새로고침"""
         try:
-            self._monitors = self.api.enum_display_monitors()
-            self.logger.info(f"모니터 {len(self._monitors)}개 감지")
+            monitors = tuple(self.api.enum_display_monitors())
+
+            # 주/보조 모니터 조회 결과를 미리 계산
+            self._primary = next((m for m in monitors if m.is_primary), None)
+            self._secondary = tuple(m for m in monitors if not m.is_primary)
+            self._monitors = monitors
+            self.logger.info("모니터 %s개 감지", len(self._monitors))
             return True
         except Exception as e:
-            self.logger.error(f"모니터 새로고침 실패: {str(e)}")
+            self.logger.error("모니터 새로고침 실패: %s", e)
             return False
 
-    def get_monitors(self) -> List[MonitorInfo]:
-        """모든 모니터 정보 반환"""
-        return self._monitors.copy()
+    def get_monitors(self) -> Tuple[MonitorInfo, ...]:
+        """모든 모니터 정보 반환 (읽기 전용 튜플)"""
+        return self._monitors
 
     def get_primary_monitor(self) -> Optional[MonitorInfo]:
         """주 모니터 반환"""
-        for monitor in self._monitors:
-            if monitor.is_primary:
-                return monitor
-        return None
+        return self._primary
 
     def get_monitor_by_index(self, index: int) -> Optional[MonitorInfo]:
         """인덱스로 모니터 조회 (0: 주모니터, 1+: 보조모니터)"""
         if index == 0:
-            return self.get_primary_monitor()
+            return self._primary
 
-        secondary = [m for m in self._monitors if not m.is_primary]
-        if 1 <= index <= len(secondary):
-            return secondary[index - 1]
+        if 1 <= index <= len(self._secondary):
+            return self._secondary[index - 1]
         return None
\ No newline at end of file
@@ -4,11 +4,24 @@
 사용자가 지정한 창만 가상 데스크톱을 따라다니도록 하는 시스템
 """
 import json
+import threading
 import time
-from typing import Set, Dict, List, Optional
+import win32con
+import win32gui
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
-from .windows_api import WindowsAPIWrapper
+from .models import WindowInfo
+from .windows_api import WindowsAPIWrapper, SYSTEM_WINDOW_TITLES
 from .logger import get_logger
+from .config_manager import FLUSH_DELAY, write_json_atomic
+from .error_handler import get_resource_manager
+
+# 고정 창 동시 이동 최대 작업자 수
+MAX_MOVE_WORKERS = 8
+
+# 고정 창 목록 캐시 유지 시간 (초) - 창 위치/표시 상태 변화가 반영되는 최대 지연
+PINNED_CACHE_TTL = 0.5
 
 
 class SelectiveWindowManager:
@@ -25,9 +38,24 @@ class SelectiveWindowManager:
         # 고정된 창 목록 (hwnd -> 창 정보)
         self._pinned_windows: Dict[int, dict] = {}
 
+        # 고정 목록 변경 버전과 get_pinned_windows 결과 캐시 (버전, 생성 시각, 목록)
+        self._version = 0
+        self._pinned_cache: Optional[Tuple[int, float, List[dict]]] = None
+
+        # 포어그라운드 활성화는 한 번에 한 창씩 (동시 이동 시 활성화 순서 경쟁 방지)
+        self._activation_lock = threading.Lock()
+
+        # 지연 저장 상태
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._write_timer: Optional[threading.Timer] = None
+
         # 설정 로드
         self._load_pinned_windows()
 
+        # 종료 시 대기 중인 변경 사항 강제 저장
+        get_resource_manager().register_cleanup(self._flush, "SelectiveWindowManager.flush")
+
     def _load_pinned_windows(self):
         """고정된 창 목록 로드"""
         try:
@@ -36,51 +64,82 @@ class SelectiveWindowManager:
                     data = json.load(f)
                     # hwnd는 문자열로 저장되므로 정수로 변환
                     self._pinned_windows = {int(k): v for k, v in data.items()}
-                self.logger.info(f"고정된 창 {len(self._pinned_windows)}개 로드")
+                self.logger.info("고정된 창 %s개 로드", len(self._pinned_windows))
             else:
                 self._pinned_windows = {}
                 self.logger.info("고정된 창 설정 파일이 없어 빈 목록으로 시작")
         except Exception as e:
-            self.logger.error(f"고정된 창 목록 로드 실패: {str(e)}")
+            self.logger.error("고정된 창 목록 로드 실패: %s", e)
             self._pinned_windows = {}
 
     def _save_pinned_windows(self):
         """고정된 창 목록 저장"""
         try:
             self.config_dir.mkdir(exist_ok=True)
-            # hwnd를 문자열로 변환하여 저장
-            data = {str(k): v for k, v in self._pinned_windows.items()}
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            self.logger.info(f"고정된 창 {len(self._pinned_windows)}개 저장")
+            # hwnd 키는 저장 시 문자열로 변환됨 (복사본 기준으로 기록)
+            write_json_atomic(self.config_file, dict(self._pinned_windows))
+            self.logger.info("고정된 창 %s개 저장", len(self._pinned_windows))
             return True
         except Exception as e:
-            self.logger.error(f"고정된 창 목록 저장 실패: {str(e)}")
+            self.logger.error("고정된 창 목록 저장 실패: %s", e)
             return False
 
+    def _schedule_save(self) -> None:
+        """지연 저장 예약 (대기 중인 예약은 취소 후 재설정)"""
+        with self._lock:
+            self._dirty = True
+            if self._write_timer:
+                self._write_timer.cancel()
+            self._write_timer = threading.Timer(FLUSH_DELAY, self._flush)
+            self._write_timer.daemon = True
+            self._write_timer.start()
+
+    def _flush(self) -> None:
+        """대기 중인 고정 창 변경을 파일에 기록"""
+        with self._lock:
+            if self._write_timer:
+                self._write_timer.cancel()
+                self._write_timer = None
+
+            if not self._dirty:
+                return
+
+            self._dirty = False
+            self._save_pinned_windows()
+
     def add_pinned_window(self, hwnd: int) -> bool:
         """창을 고정 목록에 추가"""
-        try:
-            window_info = self.api.get_window_info(hwnd)
-            if not window_info:
-                self.logger.warning(f"창 정보를 가져올 수 없음: {hwnd}")
-                return False
+        return self.add_pinned_windows([hwnd]) == 1
 
-            # 창 정보 저장
-            self._pinned_windows[hwnd] = {
-                'title': window_info.title,
-                'class_name': window_info.class_name,
-                'process_id': window_info.process_id,
-                'added_time': time.time()
-            }
+    def add_pinned_windows(self, hwnds: List[int]) -> int:
+        """여러 창을 고정 목록에 추가하고 추가된 창 개수 반환 (저장은 한 번만 예약)"""
+        added = 0
 
-            self._save_pinned_windows()
-            self.logger.info(f"창 고정 추가: {hwnd} '{window_info.title}'")
-            return True
+        try:
+            added_time = time.time()
+            for hwnd in hwnds:
+                window_info = self.api.get_window_info(hwnd)
+                if not window_info:
+                    self.logger.warning("창 정보를 가져올 수 없음: %s", hwnd)
+                    continue
+
+                # 창 정보 저장
+                self._pinned_windows[hwnd] = {
+                    'title': window_info.title,
+                    'class_name': window_info.class_name,
+                    'process_id': window_info.process_id,
+                    'added_time': added_time
+                }
+                added += 1
+                self.logger.info("창 고정 추가: %s '%s'", hwnd, window_info.title)
 
         except Exception as e:
-            self.logger.error(f"창 고정 추가 실패: {str(e)}")
-            return False
+            self.logger.error("창 고정 추가 실패: %s", e)
+
+        if added:
+            self._version += 1
+            self._schedule_save()
+        return added
 
     def remove_pinned_window(self, hwnd: int) -> bool:
         """창을 고정 목록에서 제거"""
@@ -88,112 +147,133 @@ class SelectiveWindowManager:
             if hwnd in self._pinned_windows:
                 window_info = self._pinned_windows[hwnd]
                 del self._pinned_windows[hwnd]
-                self._save_pinned_windows()
-                self.logger.info(f"창 고정 제거: {hwnd} '{window_info.get('title', 'Unknown')}'")
+                self._version += 1
+                self._schedule_save()
+                self.logger.info("창 고정 제거: %s '%s'", hwnd, window_info.get('title', 'Unknown'))
                 return True
             else:
-                self.logger.warning(f"고정되지 않은 창: {hwnd}")
+                self.logger.warning("고정되지 않은 창: %s", hwnd)
                 return False
         except Exception as e:
-            self.logger.error(f"창 고정 제거 실패: {str(e)}")
+            self.logger.error("창 고정 제거 실패: %s", e)
             return False
 
-    def get_pinned_windows(self) -> List[dict]:
-        """고정된 창 목록 반환 (유효한 창만)"""
-        valid_windows = []
-        invalid_hwnds = []
-
-        for hwnd, info in self._pinned_windows.items():
-            if self.api.is_window_valid(hwnd):
-                current_info = self.api.get_window_info(hwnd)
-                if current_info:
-                    valid_windows.append({
-                        'hwnd': hwnd,
-                        'title': current_info.title,
-                        'class_name': current_info.class_name,
-                        'process_id': current_info.process_id,
-                        'x': current_info.x,
-                        'y': current_info.y,
-                        'width': current_info.width,
-                        'height': current_info.height,
-                        'is_visible': current_info.is_visible,
-                        'original_info': info
-                    })
-                else:
-                    invalid_hwnds.append(hwnd)
-            else:
-                invalid_hwnds.append(hwnd)
+    def _iter_valid_pinned(self) -> Iterator[Tuple[int, dict, WindowInfo]]:
+        """유효한 고정 창의 (hwnd, 저장된 정보, 현재 창 정보) 순회 (유효하지 않은 창은 제거)"""
+        removed = 0
 
-        # 유효하지 않은 창들 제거
-        if invalid_hwnds:
-            for hwnd in invalid_hwnds:
+        for hwnd, info in list(self._pinned_windows.items()):
+            # get_window_info가 IsWindow 검사를 포함하므로 None이면 유효하지 않은 창
+            current_info = self.api.get_window_info(hwnd)
+            if current_info is None:
                 del self._pinned_windows[hwnd]
-            self._save_pinned_windows()
-            self.logger.info(f"유효하지 않은 창 {len(invalid_hwnds)}개 제거")
+                removed += 1
+                continue
+
+            yield hwnd, info, current_info
+
+        # 유효하지 않은 창들 제거 내용 저장
+        if removed:
+            self._version += 1
+            self._schedule_save()
+            self.logger.info("유효하지 않은 창 %s개 제거", removed)
+
+    def get_pinned_count(self) -> int:
+        """고정 목록에 등록된 창 개수 (창 유효성 검사 없이 바로 반환)"""
+        return len(self._pinned_windows)
 
-        return valid_windows
+    def get_pinned_windows(self) -> List[dict]:
+        """고정된 창 목록 반환 (유효한 창만, 목록이 바뀌지 않았으면 짧은 시간 동안 캐시 사용)"""
+        now = time.monotonic()
+        cache = self._pinned_cache
+        if cache is not None and cache[0] == self._version and now - cache[1] < PINNED_CACHE_TTL:
+            return list(cache[2])
+
+        windows = [
+            {
+                'hwnd': hwnd,
+                'title': current_info.title,
+                'class_name': current_info.class_name,
+                'process_id': current_info.process_id,
+                'x': current_info.x,
+                'y': current_info.y,
+                'width': current_info.width,
+                'height': current_info.height,
+                'is_visible': current_info.is_visible,
+                'original_info': info
+            }
+            for hwnd, info, current_info in self._iter_valid_pinned()
+        ]
+        self._pinned_cache = (self._version, now, windows)
+        return list(windows)
 
     def move_pinned_windows_to_current_desktop(self) -> int:
         """고정된 창들을 현재 가상 데스크톱으로 이동"""
         pinned_windows = self.get_pinned_windows()
-        moved_count = 0
 
         if not pinned_windows:
             self.logger.debug("고정된 창이 없음")
             return 0
 
-        self.logger.info(f"고정된 창 {len(pinned_windows)}개를 현재 데스크톱으로 이동 시도")
-
-        for window in pinned_windows:
-            hwnd = window['hwnd']
-            if self._move_window_to_current_desktop(hwnd, window):
-                moved_count += 1
-
-        self.logger.info(f"고정된 창 {moved_count}개 이동 완료")
+        self.logger.info("고정된 창 %s개를 현재 데스크톱으로 이동 시도", len(pinned_windows))
+
+        if len(pinned_windows) == 1:
+            window = pinned_windows[0]
+            moved_count = int(self._move_window_to_current_desktop(window['hwnd'], window))
+        else:
+            # 숨김/표시와 대기 시간(sleep)이 겹치도록 동시에 이동 (활성화는 _activation_lock으로 직렬화)
+            workers = min(len(pinned_windows), MAX_MOVE_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pin-move") as pool:
+                results = pool.map(lambda w: self._move_window_to_current_desktop(w['hwnd'], w),
+                                   pinned_windows)
+                moved_count = sum(results)
+
+        # 이동 후 창 위치/표시 상태가 바뀌었으므로 캐시 무효화
+        self._version += 1
+        self.logger.info("고정된 창 %s개 이동 완료", moved_count)
         return moved_count
 
     def _move_window_to_current_desktop(self, hwnd: int, window_info: dict) -> bool:
         """개별 창을 현재 가상 데스크톱으로 이동"""
         try:
-            import win32gui
-            import win32con
-
             title = window_info.get('title', 'Unknown')
             is_fullscreen = (window_info['x'] == -32000 and window_info['y'] == -32000)
 
             if is_fullscreen:
-                self.logger.debug(f"전체화면 고정 창 이동: {hwnd} '{title}'")
+                self.logger.debug("전체화면 고정 창 이동: %s '%s'", hwnd, title)
 
                 # 전체화면 창 처리
                 win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
                 time.sleep(0.2)
 
-                try:
-                    win32gui.SetForegroundWindow(hwnd)
-                    time.sleep(0.2)
-                except:
-                    pass
+                with self._activation_lock:
+                    try:
+                        win32gui.SetForegroundWindow(hwnd)
+                        time.sleep(0.2)
+                    except:
+                        pass
 
                 win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
 
             else:
-                self.logger.debug(f"일반 고정 창 이동: {hwnd} '{title}'")
+                self.logger.debug("일반 고정 창 이동: %s '%s'", hwnd, title)
 
                 # 일반 창 처리
                 win32gui.ShowWindow(hwnd, win32con.SW_HIDE)
                 time.sleep(0.1)
                 win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
 
-                try:
-                    win32gui.SetForegroundWindow(hwnd)
-                    time.sleep(0.1)
-                except:
-                    pass
+                with self._activation_lock:
+                    try:
+                        win32gui.SetForegroundWindow(hwnd)
+                        time.sleep(0.1)
+                    except:
+                        pass
 
             return True
 
         except Exception as e:
-            self.logger.error(f"고정 창 이동 실패 (hwnd: {hwnd}): {str(e)}")
+            self.logger.error("고정 창 이동 실패 (hwnd: %s): %s", hwnd, e)
             return False
 
     def get_current_windows_for_selection(self) -> List[dict]:
@@ -204,43 +284,45 @@ class SelectiveWindowManager:
             handles = self.api.enum_windows()
             for hwnd in handles:
                 window_info = self.api.get_window_info(hwnd)
-                if (window_info and window_info.is_visible and
-                    window_info.title.strip() and len(window_info.title.strip()) > 0):
-
-                    # 시스템 창 제외
-                    excluded_titles = ['Program Manager', 'Windows 입력 환경', 'Desktop Window Manager']
-                    if window_info.title not in excluded_titles:
-                        windows.append({
-                            'hwnd': hwnd,
-                            'title': window_info.title,
-                            'class_name': window_info.class_name,
-                            'process_id': window_info.process_id,
-                            'x': window_info.x,
-                            'y': window_info.y,
-                            'is_pinned': hwnd in self._pinned_windows
-                        })
+                if not window_info or not window_info.is_visible:
+                    continue
+
+                # 제목 없는 창과 시스템 창 제외
+                title = window_info.title
+                if not title or not title.strip() or title in SYSTEM_WINDOW_TITLES:
+                    continue
+
+                windows.append({
+                    'hwnd': hwnd,
+                    'title': title,
+                    'class_name': window_info.class_name,
+                    'process_id': window_info.process_id,
+                    'x': window_info.x,
+                    'y': window_info.y,
+                    'is_pinned': hwnd in self._pinned_windows
+                })
 
             # 제목 순으로 정렬
             windows.sort(key=lambda w: w['title'].lower())
 
         except Exception as e:
-            self.logger.error(f"창 목록 수집 실패: {str(e)}")
+            self.logger.error("창 목록 수집 실패: %s", e)
 
         return windows
 
     def get_status(self) -> dict:
         """현재 상태 반환"""
-        pinned_windows = self.get_pinned_windows()
+        pinned_windows = [
+            {
+                'hwnd': hwnd,
+                'title': current_info.title,
+                'is_visible': current_info.is_visible
+            }
+            for hwnd, _, current_info in self._iter_valid_pinned()
+        ]
 
         return {
             'pinned_count': len(pinned_windows),
-            'pinned_windows': [
-                {
-                    'hwnd': w['hwnd'],
-                    'title': w['title'],
-                    'is_visible': w['is_visible']
-                }
-                for w in pinned_windows
-            ],
+            'pinned_windows': pinned_windows,
             'config_file': str(self.config_file)
         }
\ No newline at end of file
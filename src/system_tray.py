@@ -1,12 +1,69 @@
 """
 시스템 트레이 UI - 최소 기능 구현
 """
+import difflib
+import functools
 import tkinter as tk
 from tkinter import messagebox
-import threading
 from typing import Callable, Optional
 from .logger import get_logger
 
+# 종료 버튼 두 번째 클릭을 기다리는 시간 (ms)
+EXIT_CONFIRM_MS = 2000
+
+# 창 관리 대화상자 상태 표시줄 메시지 유지 시간 (ms)
+STATUS_CLEAR_MS = 2000
+
+# 목록 항목 상태 접미사
+_S_PINNED = " [고정됨]"
+_S_EMPTY = ""
+_S_VIS = " [보임]"
+_S_HID = " [숨김]"
+
+# 화면 크기 캐시 (최초 대화상자 배치 시 한 번만 조회)
+_SCREEN_W: Optional[int] = None
+_SCREEN_H: Optional[int] = None
+
+
+def _center(dialog: tk.Toplevel, width: int, height: int) -> None:
+    """대화상자 크기와 화면 중앙 위치를 한 번에 지정 (레이아웃 계산 없이 배치)"""
+    global _SCREEN_W, _SCREEN_H
+    if _SCREEN_W is None:
+        _SCREEN_W = dialog.winfo_screenwidth()
+        _SCREEN_H = dialog.winfo_screenheight()
+
+    x = (_SCREEN_W - width) // 2
+    y = (_SCREEN_H - height) // 2
+    dialog.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def _sync_listbox(listbox: tk.Listbox, rendered: list, items: list) -> None:
+    """이전에 표시한 행과 비교해 바뀐 구간만 delete/insert (뒤쪽 구간부터 적용해 인덱스 유지)"""
+    opcodes = difflib.SequenceMatcher(a=rendered, b=items, autojunk=False).get_opcodes()
+    delete = listbox.delete
+    insert = listbox.insert
+    for tag, i1, i2, j1, j2 in reversed(opcodes):
+        if tag == 'equal':
+            continue
+        if i2 > i1:
+            delete(i1, i2 - 1)
+        if j2 > j1:
+            insert(i1, *items[j1:j2])
+
+
+def _guarded(name: str):
+    """버튼 처리 메서드의 예외를 로그와 오류 대화상자로 처리하는 데코레이터"""
+    def deco(fn):
+        @functools.wraps(fn)
+        def wrap(self):
+            try:
+                fn(self)
+            except Exception as e:
+                self.logger.error(f"{name} 콜백 실행 중 오류: {str(e)}")
+                messagebox.showerror("오류", f"{name} 실행 중 오류가 발생했습니다: {str(e)}")
+        return wrap
+    return deco
+
 
 class SystemTrayIcon:
     """시스템 트레이 아이콘 클래스 (간단한 GUI 창으로 대체)"""
@@ -20,6 +77,8 @@ class SystemTrayIcon:
         self.window_management_callback: Optional[Callable] = None
         self.exit_callback: Optional[Callable] = None
         self._running = False
+        self._pending_status: Optional[bool] = None  # 반영 대기 중인 상태 (None: 예약 없음)
+        self._exit_armed = False  # 종료 버튼이 한 번 눌려 확인 대기 중인지 여부
 
     def set_callbacks(self, toggle_callback: Callable = None,
                      settings_callback: Callable = None,
@@ -39,11 +98,13 @@ class SystemTrayIcon:
             self.root.geometry("300x200")
 
             # 상태 표시
-            self.status_label = tk.Label(self.root, text="상태: 비활성화", font=("Arial", 12))
+            self.status_label = tk.Label(self.root, text="상태: 활성화" if self.enabled else "상태: 비활성화",
+                                         font=("Arial", 12))
             self.status_label.pack(pady=10)
 
             # 토글 버튼
-            self.toggle_btn = tk.Button(self.root, text="활성화", command=self._on_toggle)
+            self.toggle_btn = tk.Button(self.root, text="비활성화" if self.enabled else "활성화",
+                                        command=self._on_toggle)
             self.toggle_btn.pack(pady=5)
 
             # 창 관리 버튼
@@ -55,8 +116,8 @@ class SystemTrayIcon:
             settings_btn.pack(pady=5)
 
             # 종료 버튼
-            exit_btn = tk.Button(self.root, text="종료", command=self._on_exit)
-            exit_btn.pack(pady=5)
+            self.exit_btn = tk.Button(self.root, text="종료", command=self._on_exit)
+            self.exit_btn.pack(pady=5)
 
             # 창 닫기 이벤트 처리
             self.root.protocol("WM_DELETE_WINDOW", self._on_exit)
@@ -82,55 +143,72 @@ class SystemTrayIcon:
             self.logger.info("시스템 트레이 UI 중지")
 
     def update_status(self, enabled: bool) -> None:
-        """상태 업데이트"""
+        """상태 업데이트 (연속 호출 시 유휴 시점에 마지막 상태만 반영)"""
+        if self.enabled == enabled and self.root:
+            return  # 상태 변화 없음 - Tcl 호출 생략
+
         self.enabled = enabled
         if self.root:
-            status_text = "상태: 활성화" if enabled else "상태: 비활성화"
-            self.status_label.config(text=status_text)
+            scheduled = self._pending_status is not None
+            self._pending_status = enabled
+            if not scheduled:
+                self.root.after_idle(self._flush_status)
+
+    def _flush_status(self) -> None:
+        """대기 중인 상태를 UI에 반영"""
+        enabled = self._pending_status
+        self._pending_status = None
+        if enabled is None:
+            return
 
-            toggle_text = "비활성화" if enabled else "활성화"
-            self.toggle_btn.config(text=toggle_text)
+        status_text = "상태: 활성화" if enabled else "상태: 비활성화"
+        self.status_label.config(text=status_text)
 
+        toggle_text = "비활성화" if enabled else "활성화"
+        self.toggle_btn.config(text=toggle_text)
+
+    @_guarded("토글")
     def _on_toggle(self) -> None:
         """토글 버튼 클릭 처리"""
         if self.toggle_callback:
-            try:
-                self.toggle_callback()
-            except Exception as e:
-                self.logger.error(f"토글 콜백 실행 중 오류: {str(e)}")
-                messagebox.showerror("오류", f"토글 실행 중 오류가 발생했습니다: {str(e)}")
+            self.toggle_callback()
 
+    @_guarded("창 관리")
     def _on_window_management(self) -> None:
         """창 관리 버튼 클릭 처리"""
         if self.window_management_callback:
-            try:
-                self.window_management_callback()
-            except Exception as e:
-                self.logger.error(f"창 관리 콜백 실행 중 오류: {str(e)}")
-                messagebox.showerror("오류", f"창 관리 실행 중 오류가 발생했습니다: {str(e)}")
+            self.window_management_callback()
         else:
             messagebox.showinfo("창 관리", "창 관리 기능은 아직 구현되지 않았습니다.")
 
+    @_guarded("설정")
     def _on_settings(self) -> None:
         """설정 버튼 클릭 처리"""
         if self.settings_callback:
-            try:
-                self.settings_callback()
-            except Exception as e:
-                self.logger.error(f"설정 콜백 실행 중 오류: {str(e)}")
-                messagebox.showerror("오류", f"설정 실행 중 오류가 발생했습니다: {str(e)}")
+            self.settings_callback()
         else:
             messagebox.showinfo("설정", "설정 기능은 아직 구현되지 않았습니다.")
 
     def _on_exit(self) -> None:
-        """종료 버튼 클릭 처리"""
-        if messagebox.askquestion("종료", "정말로 종료하시겠습니까?") == "yes":
-            if self.exit_callback:
-                try:
-                    self.exit_callback()
-                except Exception as e:
-                    self.logger.error(f"종료 콜백 실행 중 오류: {str(e)}")
-            self.stop()
+        """종료 버튼 클릭 처리 (확인 대화상자 대신 일정 시간 안에 한 번 더 누르면 종료)"""
+        if not self._exit_armed:
+            self._exit_armed = True
+            self.exit_btn.config(text="종료 확인 (한 번 더 클릭)")
+            self.root.after(EXIT_CONFIRM_MS, self._disarm_exit)
+            return
+
+        if self.exit_callback:
+            try:
+                self.exit_callback()
+            except Exception as e:
+                self.logger.error(f"종료 콜백 실행 중 오류: {str(e)}")
+        self.stop()
+
+    def _disarm_exit(self) -> None:
+        """종료 확인 대기 해제"""
+        self._exit_armed = False
+        if self._running:
+            self.exit_btn.config(text="종료")
 
     def is_running(self) -> bool:
         """실행 상태 반환"""
@@ -148,136 +226,195 @@ class WindowManagementDialog:
         self.window_listbox = None
         self.pinned_listbox = None
 
+        # 리스트박스 내용 (Tcl 리스트 변수 - 한 번의 대입으로 전체 교체)
+        self._windows_var: Optional[tk.Variable] = None
+        self._pinned_var: Optional[tk.Variable] = None
+
+        # 마지막 새로고침 시 표시한 목록 (리스트박스 인덱스와 일치)
+        self._cached_windows = []
+        self._cached_pinned = []
+        # 목록 상자에 현재 표시된 행 (변경분만 갱신하기 위해 보관)
+        self._rendered_windows: list = []
+        self._rendered_pinned: list = []
+        self._refresh_scheduled = False  # 두 목록 새로고침이 유휴 시점에 예약되어 있는지 여부
+        self.status_label = None
+        self._status_clear_id = None  # 상태 표시줄 지우기 예약 ID
+
     def show(self, window_manager) -> None:
         """창 관리 대화상자 표시"""
         try:
             self.window_manager = window_manager
-            self.dialog = tk.Toplevel(self.parent)
-            self.dialog.title("창 관리 - 가상 데스크톱 고정 설정")
-            self.dialog.geometry("800x600")
-            self.dialog.resizable(True, True)
+            if self.dialog is None or not self.dialog.winfo_exists():
+                # 최초 표시 시에만 위젯 생성 (이후에는 숨겨 둔 창을 다시 표시)
+                self._build_dialog()
+
+                # 창 크기/중앙 위치 지정 후 모달 설정 (레이아웃 확정 전 grab으로 인한 조기 매핑 방지)
+                _center(self.dialog, 800, 600)
+                self.dialog.transient(self.parent)
+            else:
+                self.dialog.deiconify()
+                self.dialog.lift()
 
-            # 모달 설정
-            self.dialog.transient(self.parent)
             self.dialog.grab_set()
 
-            # 메인 프레임
-            main_frame = tk.Frame(self.dialog)
-            main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+            # 데이터 로드
+            self._refresh_windows()
+            self._refresh_pinned()
 
-            # 설명 라벨
-            desc_label = tk.Label(main_frame,
-                                text="가상 데스크톱을 따라다닐 창을 선택하세요.\n"
-                                     "고정된 창은 가상 데스크톱 전환 시 자동으로 현재 데스크톱으로 이동합니다.",
-                                font=("Arial", 10), justify=tk.LEFT)
-            desc_label.pack(pady=(0, 10))
+            self.logger.info("창 관리 대화상자 표시")
 
-            # 좌우 분할 프레임
-            content_frame = tk.Frame(main_frame)
-            content_frame.pack(fill=tk.BOTH, expand=True)
+        except Exception as e:
+            self.logger.error(f"창 관리 대화상자 표시 실패: {str(e)}")
 
-            # 왼쪽: 전체 창 목록
-            left_frame = tk.Frame(content_frame)
-            left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
+    def _build_dialog(self) -> None:
+        """대화상자 위젯 생성"""
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.title("창 관리 - 가상 데스크톱 고정 설정")
+        self.dialog.resizable(True, True)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._close_dialog)
+        self._rendered_windows = []
+        self._rendered_pinned = []
 
-            tk.Label(left_frame, text="전체 창 목록", font=("Arial", 12, "bold")).pack()
+        # 메인 프레임
+        main_frame = tk.Frame(self.dialog)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
-            # 창 목록 리스트박스
-            list_frame = tk.Frame(left_frame)
-            list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        # 설명 라벨
+        desc_label = tk.Label(main_frame,
+                            text="가상 데스크톱을 따라다닐 창을 선택하세요.\n"
+                                 "고정된 창은 가상 데스크톱 전환 시 자동으로 현재 데스크톱으로 이동합니다.",
+                            font=("Arial", 10), justify=tk.LEFT)
+        desc_label.pack(pady=(0, 10))
 
-            scrollbar1 = tk.Scrollbar(list_frame)
-            scrollbar1.pack(side=tk.RIGHT, fill=tk.Y)
+        # 좌우 분할 프레임
+        content_frame = tk.Frame(main_frame)
+        content_frame.pack(fill=tk.BOTH, expand=True)
 
-            self.window_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar1.set,
-                                           selectmode=tk.SINGLE, font=("Arial", 9))
-            self.window_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            scrollbar1.config(command=self.window_listbox.yview)
+        # 왼쪽: 전체 창 목록
+        left_frame = tk.Frame(content_frame)
+        left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
 
-            # 버튼 프레임
-            btn_frame1 = tk.Frame(left_frame)
-            btn_frame1.pack(pady=5)
+        tk.Label(left_frame, text="전체 창 목록", font=("Arial", 12, "bold")).pack()
 
-            tk.Button(btn_frame1, text="→ 고정 추가", command=self._add_pinned).pack(side=tk.LEFT, padx=2)
-            tk.Button(btn_frame1, text="새로고침", command=self._refresh_windows).pack(side=tk.LEFT, padx=2)
+        # 창 목록 리스트박스
+        list_frame = tk.Frame(left_frame)
+        list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-            # 오른쪽: 고정된 창 목록
-            right_frame = tk.Frame(content_frame)
-            right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        scrollbar1 = tk.Scrollbar(list_frame)
+        scrollbar1.pack(side=tk.RIGHT, fill=tk.Y)
 
-            tk.Label(right_frame, text="고정된 창 목록", font=("Arial", 12, "bold")).pack()
+        self._windows_var = tk.Variable(self.dialog, value=())
+        self.window_listbox = tk.Listbox(list_frame, yscrollcommand=scrollbar1.set,
+                                       listvariable=self._windows_var,
+                                       selectmode=tk.SINGLE, font=("Arial", 9))
+        self.window_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar1.config(command=self.window_listbox.yview)
 
-            # 고정된 창 리스트박스
-            pinned_frame = tk.Frame(right_frame)
-            pinned_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        # 버튼 프레임
+        btn_frame1 = tk.Frame(left_frame)
+        btn_frame1.pack(pady=5)
 
-            scrollbar2 = tk.Scrollbar(pinned_frame)
-            scrollbar2.pack(side=tk.RIGHT, fill=tk.Y)
+        tk.Button(btn_frame1, text="→ 고정 추가", command=self._add_pinned).pack(side=tk.LEFT, padx=2)
+        tk.Button(btn_frame1, text="새로고침", command=self._refresh_windows).pack(side=tk.LEFT, padx=2)
 
-            self.pinned_listbox = tk.Listbox(pinned_frame, yscrollcommand=scrollbar2.set,
-                                           selectmode=tk.SINGLE, font=("Arial", 9))
-            self.pinned_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            scrollbar2.config(command=self.pinned_listbox.yview)
+        # 오른쪽: 고정된 창 목록
+        right_frame = tk.Frame(content_frame)
+        right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
 
-            # 버튼 프레임
-            btn_frame2 = tk.Frame(right_frame)
-            btn_frame2.pack(pady=5)
+        tk.Label(right_frame, text="고정된 창 목록", font=("Arial", 12, "bold")).pack()
 
-            tk.Button(btn_frame2, text="← 고정 해제", command=self._remove_pinned).pack(side=tk.LEFT, padx=2)
+        # 고정된 창 리스트박스
+        pinned_frame = tk.Frame(right_frame)
+        pinned_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-            # 하단 버튼
-            bottom_frame = tk.Frame(main_frame)
-            bottom_frame.pack(pady=10)
+        scrollbar2 = tk.Scrollbar(pinned_frame)
+        scrollbar2.pack(side=tk.RIGHT, fill=tk.Y)
 
-            tk.Button(bottom_frame, text="닫기", command=self._close_dialog).pack()
+        self._pinned_var = tk.Variable(self.dialog, value=())
+        self.pinned_listbox = tk.Listbox(pinned_frame, yscrollcommand=scrollbar2.set,
+                                       listvariable=self._pinned_var,
+                                       selectmode=tk.SINGLE, font=("Arial", 9))
+        self.pinned_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar2.config(command=self.pinned_listbox.yview)
 
-            # 창 중앙 배치
-            self.dialog.update_idletasks()
-            x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-            y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-            self.dialog.geometry(f"+{x}+{y}")
+        # 버튼 프레임
+        btn_frame2 = tk.Frame(right_frame)
+        btn_frame2.pack(pady=5)
 
-            # 초기 데이터 로드
-            self._refresh_windows()
-            self._refresh_pinned()
+        tk.Button(btn_frame2, text="← 고정 해제", command=self._remove_pinned).pack(side=tk.LEFT, padx=2)
 
-            self.logger.info("창 관리 대화상자 표시")
+        # 하단 버튼
+        bottom_frame = tk.Frame(main_frame)
+        bottom_frame.pack(pady=10)
 
-        except Exception as e:
-            self.logger.error(f"창 관리 대화상자 표시 실패: {str(e)}")
+        # 결과 안내용 상태 표시줄 (모달 알림 대화상자 대신 사용)
+        self.status_label = tk.Label(bottom_frame, text="", font=("Arial", 9))
+        self.status_label.pack()
+
+        tk.Button(bottom_frame, text="닫기", command=self._close_dialog).pack()
 
     def _refresh_windows(self) -> None:
         """전체 창 목록 새로고침"""
         try:
-            self.window_listbox.delete(0, tk.END)
+            self._cached_windows = []
             windows = self.window_manager.get_current_windows_for_selection()
+            self._cached_windows = windows
 
-            for window in windows:
-                status = " [고정됨]" if window['is_pinned'] else ""
-                display_text = f"{window['title']}{status}"
-                self.window_listbox.insert(tk.END, display_text)
+            # 바뀐 행만 갱신 (창 하나 추가/제거 시 Tcl 호출 두어 번)
+            items = [w['title'] + (_S_PINNED if w['is_pinned'] else _S_EMPTY) for w in windows]
+            _sync_listbox(self.window_listbox, self._rendered_windows, items)
+            self._rendered_windows = items
 
             self.logger.debug(f"전체 창 목록 새로고침: {len(windows)}개")
 
         except Exception as e:
+            self._windows_var.set(())
+            self._rendered_windows = []
             self.logger.error(f"창 목록 새로고침 실패: {str(e)}")
 
     def _refresh_pinned(self) -> None:
         """고정된 창 목록 새로고침"""
         try:
-            self.pinned_listbox.delete(0, tk.END)
+            self._cached_pinned = []
             pinned_windows = self.window_manager.get_pinned_windows()
+            self._cached_pinned = pinned_windows
 
-            for window in pinned_windows:
-                status = " [보임]" if window['is_visible'] else " [숨김]"
-                display_text = f"{window['title']}{status}"
-                self.pinned_listbox.insert(tk.END, display_text)
+            # 바뀐 행만 갱신 (창 하나 추가/제거 시 Tcl 호출 두어 번)
+            items = [w['title'] + (_S_VIS if w['is_visible'] else _S_HID) for w in pinned_windows]
+            _sync_listbox(self.pinned_listbox, self._rendered_pinned, items)
+            self._rendered_pinned = items
 
             self.logger.debug(f"고정된 창 목록 새로고침: {len(pinned_windows)}개")
 
         except Exception as e:
+            self._pinned_var.set(())
+            self._rendered_pinned = []
             self.logger.error(f"고정된 창 목록 새로고침 실패: {str(e)}")
 
+    def _show_status(self, text: str) -> None:
+        """상태 표시줄에 메시지를 잠시 표시"""
+        self.status_label.config(text=text)
+        if self._status_clear_id is not None:
+            self.dialog.after_cancel(self._status_clear_id)
+        self._status_clear_id = self.dialog.after(STATUS_CLEAR_MS, self._clear_status)
+
+    def _clear_status(self) -> None:
+        """상태 표시줄 메시지 지우기"""
+        self._status_clear_id = None
+        self.status_label.config(text="")
+
+    def _schedule_refresh(self) -> None:
+        """두 목록 새로고침을 유휴 시점 한 번으로 묶어 예약"""
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.dialog.after_idle(self._do_refresh)
+
+    def _do_refresh(self) -> None:
+        """예약된 두 목록 새로고침 실행"""
+        self._refresh_scheduled = False
+        self._refresh_windows()
+        self._refresh_pinned()
+
     def _add_pinned(self) -> None:
         """선택된 창을 고정 목록에 추가"""
         try:
@@ -287,18 +424,17 @@ class WindowManagementDialog:
                 return
 
             index = selection[0]
-            windows = self.window_manager.get_current_windows_for_selection()
+            windows = self._cached_windows
 
             if index < len(windows):
                 window = windows[index]
                 if window['is_pinned']:
-                    messagebox.showinfo("이미 고정됨", "선택한 창은 이미 고정되어 있습니다.")
+                    self._show_status("선택한 창은 이미 고정되어 있습니다.")
                     return
 
                 if self.window_manager.add_pinned_window(window['hwnd']):
-                    messagebox.showinfo("고정 완료", f"'{window['title']}' 창이 고정되었습니다.")
-                    self._refresh_windows()
-                    self._refresh_pinned()
+                    self._show_status(f"✓ '{window['title']}' 고정됨")
+                    self._schedule_refresh()
                 else:
                     messagebox.showerror("고정 실패", "창 고정에 실패했습니다.")
 
@@ -315,14 +451,13 @@ class WindowManagementDialog:
                 return
 
             index = selection[0]
-            pinned_windows = self.window_manager.get_pinned_windows()
+            pinned_windows = self._cached_pinned
 
             if index < len(pinned_windows):
                 window = pinned_windows[index]
                 if self.window_manager.remove_pinned_window(window['hwnd']):
-                    messagebox.showinfo("고정 해제", f"'{window['title']}' 창의 고정이 해제되었습니다.")
-                    self._refresh_windows()
-                    self._refresh_pinned()
+                    self._show_status(f"✓ '{window['title']}' 고정 해제됨")
+                    self._schedule_refresh()
                 else:
                     messagebox.showerror("고정 해제 실패", "창 고정 해제에 실패했습니다.")
 
@@ -331,8 +466,9 @@ class WindowManagementDialog:
             messagebox.showerror("오류", f"창 고정 해제 중 오류가 발생했습니다: {str(e)}")
 
     def _close_dialog(self) -> None:
-        """대화상자 닫기"""
-        self.dialog.destroy()
+        """대화상자 닫기 (위젯은 다음 표시 때 재사용하도록 숨김)"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
         self.logger.info("창 관리 대화상자 닫기")
 
 
@@ -352,60 +488,75 @@ class SettingsDialog:
     def show(self, current_config: dict) -> None:
         """설정 대화상자 표시"""
         try:
-            self.dialog = tk.Toplevel(self.parent)
-            self.dialog.title("설정")
-            self.dialog.geometry("400x300")
-            self.dialog.resizable(False, False)
+            if self.dialog is None or not self.dialog.winfo_exists():
+                # 최초 표시 시에만 위젯 생성 (이후에는 숨겨 둔 창을 다시 표시)
+                self._build_dialog()
+
+                # 창 크기/중앙 위치 지정 후 모달 설정 (레이아웃 확정 전 grab으로 인한 조기 매핑 방지)
+                _center(self.dialog, 400, 300)
+                self.dialog.transient(self.parent)
+            else:
+                self.dialog.deiconify()
+                self.dialog.lift()
+
+            # 현재 설정 값 반영
+            self.monitor_var.set(str(current_config.get('target_monitor_index', 1)))
+            self.log_var.set(current_config.get('log_level', 'INFO'))
+            self.hotkey_var.set(current_config.get('hotkey_enabled', True))
 
-            # 모달 설정
-            self.dialog.transient(self.parent)
             self.dialog.grab_set()
 
-            # 대상 모니터 설정
-            tk.Label(self.dialog, text="대상 모니터:", font=("Arial", 10)).pack(pady=5)
+            self.logger.info("설정 대화상자 표시")
 
-            self.monitor_var = tk.StringVar(value=str(current_config.get('target_monitor_index', 1)))
-            monitor_frame = tk.Frame(self.dialog)
-            monitor_frame.pack(pady=5)
+        except Exception as e:
+            self.logger.error(f"설정 대화상자 표시 실패: {str(e)}")
 
-            tk.Radiobutton(monitor_frame, text="주 모니터 (0)", variable=self.monitor_var,
-                          value="0").pack(side=tk.LEFT, padx=10)
-            tk.Radiobutton(monitor_frame, text="보조 모니터 (1)", variable=self.monitor_var,
-                          value="1").pack(side=tk.LEFT, padx=10)
+    def _build_dialog(self) -> None:
+        """대화상자 위젯 생성"""
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.title("설정")
+        self.dialog.resizable(False, False)
+        self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
 
-            # 로그 레벨 설정
-            tk.Label(self.dialog, text="로그 레벨:", font=("Arial", 10)).pack(pady=(20,5))
+        # 대상 모니터 설정
+        tk.Label(self.dialog, text="대상 모니터:", font=("Arial", 10)).pack(pady=5)
 
-            self.log_var = tk.StringVar(value=current_config.get('log_level', 'INFO'))
-            log_frame = tk.Frame(self.dialog)
-            log_frame.pack(pady=5)
+        self.monitor_var = tk.StringVar(self.dialog)
+        monitor_frame = tk.Frame(self.dialog)
+        monitor_frame.pack(pady=5)
 
-            for level in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
-                tk.Radiobutton(log_frame, text=level, variable=self.log_var,
-                              value=level).pack(side=tk.LEFT, padx=5)
+        tk.Radiobutton(monitor_frame, text="주 모니터 (0)", variable=self.monitor_var,
+                      value="0").pack(side=tk.LEFT, padx=10)
+        tk.Radiobutton(monitor_frame, text="보조 모니터 (1)", variable=self.monitor_var,
+                      value="1").pack(side=tk.LEFT, padx=10)
 
-            # 핫키 활성화
-            self.hotkey_var = tk.BooleanVar(value=current_config.get('hotkey_enabled', True))
-            tk.Checkbutton(self.dialog, text="핫키 활성화 (Win+Ctrl+방향키)",
-                          variable=self.hotkey_var, font=("Arial", 10)).pack(pady=10)
+        # 로그 레벨 설정
+        tk.Label(self.dialog, text="로그 레벨:", font=("Arial", 10)).pack(pady=(20,5))
 
-            # 버튼
-            btn_frame = tk.Frame(self.dialog)
-            btn_frame.pack(pady=20)
+        self.log_var = tk.StringVar(self.dialog)
+        log_frame = tk.Frame(self.dialog)
+        log_frame.pack(pady=5)
 
-            tk.Button(btn_frame, text="확인", command=self._on_ok).pack(side=tk.LEFT, padx=10)
-            tk.Button(btn_frame, text="취소", command=self._on_cancel).pack(side=tk.LEFT, padx=10)
+        for level in ['DEBUG', 'INFO', 'WARNING', 'ERROR']:
+            tk.Radiobutton(log_frame, text=level, variable=self.log_var,
+                          value=level).pack(side=tk.LEFT, padx=5)
 
-            # 창 중앙 배치
-            self.dialog.update_idletasks()
-            x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-            y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-            self.dialog.geometry(f"+{x}+{y}")
+        # 핫키 활성화
+        self.hotkey_var = tk.BooleanVar(self.dialog)
+        tk.Checkbutton(self.dialog, text="핫키 활성화 (Win+Ctrl+방향키)",
+                      variable=self.hotkey_var, font=("Arial", 10)).pack(pady=10)
 
-            self.logger.info("설정 대화상자 표시")
+        # 버튼
+        btn_frame = tk.Frame(self.dialog)
+        btn_frame.pack(pady=20)
 
-        except Exception as e:
-            self.logger.error(f"설정 대화상자 표시 실패: {str(e)}")
+        tk.Button(btn_frame, text="확인", command=self._on_ok).pack(side=tk.LEFT, padx=10)
+        tk.Button(btn_frame, text="취소", command=self._on_cancel).pack(side=tk.LEFT, padx=10)
+
+    def _hide(self) -> None:
+        """대화상자 숨김 (위젯은 다음 표시 때 재사용)"""
+        self.dialog.grab_release()
+        self.dialog.withdraw()
 
     def _on_ok(self) -> None:
         """확인 버튼 클릭 처리"""
@@ -419,7 +570,7 @@ class SettingsDialog:
             if self.config_callback:
                 self.config_callback(new_config)
 
-            self.dialog.destroy()
+            self._hide()
             self.logger.info("설정 변경 완료")
 
         except Exception as e:
@@ -428,5 +579,5 @@ class SettingsDialog:
 
     def _on_cancel(self) -> None:
         """취소 버튼 클릭 처리"""
-        self.dialog.destroy()
+        self._hide()
         self.logger.info("설정 변경 취소")
\ No newline at end of file
@@ -1,131 +1,254 @@
 """
 가상 데스크톱 제어 시스템 - 선택적 창 고정 기능
 """
-from typing import Callable, Optional
+from typing import Dict, FrozenSet, Optional, Tuple, Union
+import queue
 import time
 import threading
+import win32con
+import win32gui
 from .monitor_manager import MonitorManager
 from .selective_window_manager import SelectiveWindowManager
 from .hotkey_listener import HotkeyListener
+from .windows_api import (WindowsAPIWrapper, VirtualDesktopManager, WinEventHook,
+                          EVENT_SYSTEM_FOREGROUND, SYSTEM_WINDOW_TITLES, enum_window_handles)
 from .logger import get_logger
 
+# 데스크톱 식별자 - COM으로 얻은 GUID 문자열, 또는 보이는 창 핸들 집합 (COM 사용 불가 시)
+DesktopId = Union[str, FrozenSet[int]]
+
+# 방향별 핫키 간격 (time.monotonic_ns 기준 정수 나노초)
+_REPEAT_GATE_NS = 80_000_000  # 같은 방향 키 반복 무시 (80ms)
+_SWITCH_SETTLE_NS = 1_500_000_000  # 창 이동 후 좌/우 전환 안정화 대기 (1.5초)
+_SWITCH_DIRECTIONS = ('left', 'right')
+
+# Win+Ctrl+Alt+Down 중앙 이동 시 목표 창 크기 (너비, 높이)
+CENTER_WINDOW_SIZE = (1500, 1392)
+
 
 class VirtualDesktopController:
     """가상 데스크톱 제어 클래스 - 선택된 창만 가상 데스크톱을 따라다님"""
 
-    def __init__(self, target_monitor_index: int = 1):
+    def __init__(self, target_monitor_index: int = 1, hotkey_enabled: bool = True):
         """
         Args:
             target_monitor_index: 사용하지 않음 (하위 호환성을 위해 유지)
+            hotkey_enabled: 핫키 사용 여부 (False면 키보드 후크를 설치하지 않음)
         """
         self.logger = get_logger("VirtualDesktopController")
         self.target_monitor_index = target_monitor_index
+        self._hotkey_enabled = hotkey_enabled
 
         # 매니저 초기화
         self.monitor_manager = MonitorManager()
         self.window_manager = SelectiveWindowManager()
         self.hotkey_listener = HotkeyListener()
+        self.api = WindowsAPIWrapper()
+        self._vdm = VirtualDesktopManager()
 
         # 핫키 콜백 설정
         self.hotkey_listener.set_callback(self._on_hotkey_pressed)
 
         self._enabled = False
-        self._last_action_time = 0
-        self._action_cooldown = 1.5  # 1.5초 쿨다운 (중복 방지)
+        self._next_allowed: Dict[str, int] = {}  # 방향 -> 다음 처리 허용 시각 (monotonic_ns)
+
+        # 중앙 이동 좌표 캐시 (주 모니터 정보가 바뀔 때만 다시 계산)
+        self._center_monitor = None
+        self._center_geometry: Tuple[int, int, int, int] = (0, 0, 0, 0)
 
         # 가상 데스크톱 추적
         self._current_desktop_id = None
         self._last_desktop_id = None
         self._processing_lock = threading.Lock()  # 동시 실행 방지
 
+        # 핫키 처리 작업 큐 (키보드 후크 스레드는 큐에 넣고 바로 반환)
+        self._work_q: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+        # 데스크톱 전환 완료 대기 (변경이 감지되면 즉시 진행)
+        self._max_switch_wait = 0.8  # 최대 대기 시간 (초)
+        self._switch_poll_interval = 0.01  # 확인 간격 (초) - 포어그라운드 후크를 쓸 수 없을 때
+
+        # 데스크톱 전환 시 새 데스크톱의 창이 활성화되므로 포어그라운드 변경 이벤트로 대기를 깨움
+        self._foreground_changed = threading.Event()
+        self._foreground_hook = WinEventHook((EVENT_SYSTEM_FOREGROUND,), self._on_foreground_event,
+                                             name="ForegroundHook")
+
     def start(self) -> bool:
         """가상 데스크톱 제어 시작"""
         try:
-            # 핫키 리스너 시작
-            if self.hotkey_listener.start():
+            # 핫키 리스너 시작 (핫키 비활성화 시 키보드 후크 미설치)
+            if self.hotkey_listener.set_enabled(self._hotkey_enabled):
+                # 핫키가 꺼져 있으면 작업 스레드와 포어그라운드 후크도 설치하지 않음
+                if self._hotkey_enabled:
+                    self._start_worker()
                 self._enabled = True
                 pinned_count = len(self.window_manager.get_pinned_windows())
-                self.logger.info(f"선택적 창 고정 시스템 시작 (고정된 창: {pinned_count}개)")
+                self.logger.info("선택적 창 고정 시스템 시작 (고정된 창: %s개)", pinned_count)
                 return True
             else:
                 return False
         except Exception as e:
-            self.logger.error(f"가상 데스크톱 제어 시작 실패: {str(e)}")
+            self.logger.error("가상 데스크톱 제어 시작 실패: %s", e)
             return False
 
     def stop(self) -> None:
         """가상 데스크톱 제어 중지"""
         self._enabled = False
         self.hotkey_listener.stop()
+        self._stop_worker()
+
         self.logger.info("선택적 창 고정 시스템 중지")
 
+    def _start_worker(self) -> None:
+        """핫키 처리 작업 스레드 시작"""
+        if self._worker and self._worker.is_alive():
+            return
+
+        self._worker = threading.Thread(target=self._work_loop, name="DesktopSwitchWorker", daemon=True)
+        self._worker.start()
+
+        if not self._foreground_hook.start():
+            self.logger.warning("포어그라운드 이벤트 후크를 사용할 수 없어 주기적 확인으로 대기")
+
+    def _stop_worker(self) -> None:
+        """핫키 처리 작업 스레드 종료 요청 및 포어그라운드 후크 해제"""
+        if self._worker:
+            self._work_q.put(None)
+            self._worker = None
+        self._foreground_hook.stop()
+
+    def _on_foreground_event(self, event: int, hwnd: int) -> None:
+        """포어그라운드 창 변경 이벤트 (후크 스레드)"""
+        self._foreground_changed.set()
+
+    def _work_loop(self) -> None:
+        """작업 큐에서 (핫키 방향, 전환 전 포어그라운드 창)을 꺼내 처리 (None을 받으면 종료)"""
+        while True:
+            item = self._work_q.get()
+            if item is None:
+                break
+            self._process_hotkey(*item)
+
+    def set_hotkey_enabled(self, enabled: bool) -> None:
+        """핫키 사용 여부 변경 (실행 중이면 즉시 적용)"""
+        self._hotkey_enabled = enabled
+        if self._enabled:
+            self.hotkey_listener.set_enabled(enabled)
+            if enabled:
+                self._start_worker()
+            else:
+                self._stop_worker()
+        self.logger.info("핫키 %s", '활성화' if enabled else '비활성화')
+
     def _on_hotkey_pressed(self, direction: str) -> None:
-        """핫키 눌림 이벤트 처리"""
+        """핫키 눌림 이벤트 처리 (키보드 후크 스레드 - 작업 스레드로 넘기고 바로 반환)"""
         if not self._enabled:
             return
 
-        # 동시 실행 방지
+        # 동시 실행 방지 - 처리 중이거나 대기 중인 전환이 있으면 무시
+        if self._processing_lock.locked() or not self._work_q.empty():
+            self.logger.debug("이미 처리 중인 데스크톱 전환이 있어 무시")
+            return
+
+        # 좌/우 전환은 Windows가 데스크톱을 바꾸기 전의 포어그라운드 창만 기록 (후크 안에서는 가벼운 호출만)
+        # 창이 속한 데스크톱은 전환 후에도 바뀌지 않으므로 데스크톱 ID는 작업 스레드에서 확인
+        foreground = 0
+        if direction in _SWITCH_DIRECTIONS:
+            self._foreground_changed.clear()  # 이전 포어그라운드 이벤트는 버림
+            foreground = win32gui.GetForegroundWindow()
+
+        self._work_q.put((direction, foreground))
+
+    def _process_hotkey(self, direction: str, foreground: int = 0) -> None:
+        """핫키 처리 (작업 스레드에서 실행)"""
+        # 방향별 쿨다운 체크 - 잠금 전에 확인 (다른 방향 핫키는 막지 않음)
+        if time.monotonic_ns() < self._next_allowed.get(direction, 0):
+            self.logger.debug("쿨다운 중 (%s) - 무시", direction)
+            return
+
         if not self._processing_lock.acquire(blocking=False):
             self.logger.debug("이미 처리 중인 데스크톱 전환이 있어 무시")
             return
 
         try:
-            # 쿨다운 체크
-            current_time = time.time()
-            if current_time - self._last_action_time < self._action_cooldown:
-                self.logger.debug(f"쿨다운 중 ({self._action_cooldown}초) - 무시")
-                return
-
-            self._last_action_time = current_time
+            self.logger.info("가상 데스크톱 전환 감지: %s", direction)
+            self._handle_desktop_switch(direction, foreground)
 
-            self.logger.info(f"가상 데스크톱 전환 감지: {direction}")
-            self._handle_desktop_switch(direction)
+            # 처리가 끝난 뒤 키 반복 간격 적용 (전환 안정화 대기가 더 길면 유지)
+            repeat_until = time.monotonic_ns() + _REPEAT_GATE_NS
+            if repeat_until > self._next_allowed.get(direction, 0):
+                self._next_allowed[direction] = repeat_until
 
         except Exception as e:
-            self.logger.error(f"데스크톱 전환 처리 중 오류: {str(e)}")
+            self.logger.error("데스크톱 전환 처리 중 오류: %s", e)
         finally:
             self._processing_lock.release()
 
-    def _get_current_desktop_id(self) -> Optional[str]:
+    def _get_current_desktop_id(self) -> Optional[DesktopId]:
         """현재 가상 데스크톱 ID 가져오기"""
         try:
-            import win32gui
+            # 포어그라운드 창이 속한 데스크톱 GUID (COM 호출 한 번)
+            desktop_id = self._vdm.get_window_desktop_id(win32gui.GetForegroundWindow())
+            if desktop_id:
+                return desktop_id
 
-            # 현재 보이는 창들의 조합으로 데스크톱 상태 식별
+            # COM을 쓸 수 없거나 포어그라운드 창이 없으면 보이는 창들의 조합으로 데스크톱 상태 식별
+            # (핸들만 먼저 열거하고, 보이는 상위 10개 창을 찾을 때까지만 제목 조회)
             visible_windows = []
+            for hwnd in enum_window_handles():
+                if not hwnd or not win32gui.IsWindowVisible(hwnd):
+                    continue
+                try:
+                    title = win32gui.GetWindowText(hwnd)
+                except Exception:
+                    continue
+
+                # 제목이 있는 창만 (시스템 창 제외)
+                if title.strip() and title not in SYSTEM_WINDOW_TITLES:
+                    visible_windows.append(hwnd)
+                    if len(visible_windows) == 10:
+                        break
+
+            # 상위 10개 창의 핸들 집합을 데스크톱 식별자로 사용 (창이 없으면 빈 집합)
+            return frozenset(visible_windows)
 
-            def enum_windows_proc(hwnd, lParam):
-                if win32gui.IsWindowVisible(hwnd):
-                    try:
-                        title = win32gui.GetWindowText(hwnd)
-                        if title.strip() and len(title.strip()) > 0:  # 제목이 있는 창만
-                            # 시스템 창 제외
-                            excluded_titles = ['Program Manager', 'Windows 입력 환경', 'Desktop Window Manager']
-                            if title not in excluded_titles:
-                                visible_windows.append(hwnd)
-                    except:
-                        pass
-                return True
+        except Exception as e:
+            self.logger.debug("데스크톱 ID 가져오기 실패: %s", e)
+            return None
 
-            win32gui.EnumWindows(enum_windows_proc, 0)
+    def _wait_for_desktop_change(self, initial_id: Optional[DesktopId]) -> Optional[DesktopId]:
+        """데스크톱 ID가 바뀔 때까지 대기 후 마지막으로 확인한 ID 반환 (최대 _max_switch_wait초)"""
+        deadline = time.monotonic() + self._max_switch_wait
+        desktop_id = initial_id
 
-            # 보이는 창들의 핸들 조합으로 데스크톱 식별자 생성
-            if visible_windows:
-                # 상위 10개 창의 핸들을 정렬하여 고유 ID 생성
-                sorted_windows = sorted(visible_windows[:10])
-                desktop_id = "desktop_" + "_".join([str(hwnd % 10000) for hwnd in sorted_windows])
-                return desktop_id
+        # 후크가 동작 중이면 포어그라운드 변경 시에만 확인 (없으면 짧은 간격으로 확인)
+        changed = self._foreground_changed
+        interval = self._max_switch_wait if self._foreground_hook.is_running() else self._switch_poll_interval
 
-            return "desktop_empty"
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
 
-        except Exception as e:
-            self.logger.debug(f"데스크톱 ID 가져오기 실패: {str(e)}")
-            return None
+            changed.wait(min(interval, remaining))
+            changed.clear()
+            desktop_id = self._get_current_desktop_id()
+            if desktop_id is not None and desktop_id != initial_id:
+                break
+
+        return desktop_id
 
-    def _handle_desktop_switch(self, direction: str) -> None:
-        """데스크톱 전환 처리 - 고정된 창들만 이동"""
+    def _handle_desktop_switch(self, direction: str, foreground: int = 0) -> None:
+        """데스크톱 전환 처리 - 고정된 창들만 이동 (foreground: 핫키 후크에서 기록한 전환 전 포어그라운드 창)"""
         try:
-            self.logger.info(f"가상 데스크톱 전환 처리 시작: {direction}")
+            # 고정된 창이 없으면 데스크톱 확인/전환 대기 없이 바로 종료 (중앙 이동은 고정 창과 무관)
+            if direction != 'alt_down' and self.window_manager.get_pinned_count() == 0:
+                self._last_desktop_id = None
+                self.logger.debug("고정된 창이 없어 이동할 창이 없음")
+                return
+
+            self.logger.info("가상 데스크톱 전환 처리 시작: %s", direction)
 
             # alt_down 키는 포커스 창을 메인 모니터 중앙으로 이동
             if direction == 'alt_down':
@@ -137,56 +260,53 @@ class VirtualDesktopController:
                 self._handle_immediate_window_move()
                 return
 
-            # 현재 데스크톱 ID 확인
-            current_desktop_id = self._get_current_desktop_id()
-
-            # 같은 데스크톱에서 연속 실행 방지
-            if (current_desktop_id and
-                current_desktop_id == self._last_desktop_id and
-                self._last_desktop_id is not None):
-                self.logger.info(f"같은 데스크톱({current_desktop_id[:20]}...)에서 연속 실행 - 무시")
-                return
+            # 전환 전 데스크톱 ID - 후크에서 기록한 포어그라운드 창의 데스크톱 GUID
+            current_desktop_id = self._vdm.get_window_desktop_id(foreground) if foreground else None
+            if current_desktop_id is None:
+                # COM을 쓸 수 없으면 직전 처리 후 기록해 둔 ID를 기준으로 사용 (없을 때만 지금 확인)
+                current_desktop_id = self._last_desktop_id
+                if current_desktop_id is None:
+                    current_desktop_id = self._get_current_desktop_id()
 
             # 고정된 창 목록 확인
             pinned_windows = self.window_manager.get_pinned_windows()
 
             if pinned_windows:
-                self.logger.info(f"고정된 창 {len(pinned_windows)}개 감지")
+                self.logger.info("고정된 창 %s개 감지", len(pinned_windows))
 
-                # 가상 데스크톱 전환 완료 대기
-                time.sleep(0.8)
-
-                # 데스크톱 전환 후 ID 다시 확인
-                new_desktop_id = self._get_current_desktop_id()
+                # 가상 데스크톱 전환 완료 대기 (변경 감지 시 바로 진행)
+                new_desktop_id = self._wait_for_desktop_change(current_desktop_id)
 
                 # 실제로 데스크톱이 변경되었는지 확인
-                if new_desktop_id and new_desktop_id != current_desktop_id:
-                    self.logger.info(f"데스크톱 변경 확인: {current_desktop_id[:20]}... -> {new_desktop_id[:20]}...")
+                if new_desktop_id is not None and new_desktop_id != current_desktop_id:
+                    self.logger.info("데스크톱 변경 확인: %.20s... -> %.20s...", current_desktop_id, new_desktop_id)
 
                     # 고정된 창들을 현재 데스크톱으로 이동
                     moved_count = self.window_manager.move_pinned_windows_to_current_desktop()
 
                     if moved_count > 0:
-                        self.logger.info(f"고정된 창 {moved_count}개를 현재 데스크톱으로 이동 완료")
-                        self._last_desktop_id = new_desktop_id
-                        # 성공적으로 이동한 후 추가 쿨다운 적용
-                        self._last_action_time = time.time()
+                        self.logger.info("고정된 창 %s개를 현재 데스크톱으로 이동 완료", moved_count)
+                        # 성공적으로 이동한 후 전환 안정화 시간 동안 좌/우 전환 무시
+                        settle_until = time.monotonic_ns() + _SWITCH_SETTLE_NS
+                        for switch_direction in _SWITCH_DIRECTIONS:
+                            self._next_allowed[switch_direction] = settle_until
                     else:
                         self.logger.warning("고정된 창 이동에 실패했습니다")
                 else:
                     self.logger.info("데스크톱 변경이 감지되지 않음 - 창 이동 생략")
-                    # 데스크톱 ID 업데이트
-                    if new_desktop_id:
-                        self._last_desktop_id = new_desktop_id
+
+                # 전환 후 데스크톱 ID 기록 (COM을 쓸 수 없을 때 다음 전환의 기준)
+                if new_desktop_id is not None:
+                    self._last_desktop_id = new_desktop_id
 
             else:
                 self.logger.debug("고정된 창이 없어 이동할 창이 없음")
                 # 데스크톱 ID는 업데이트
-                if current_desktop_id:
+                if current_desktop_id is not None:
                     self._last_desktop_id = current_desktop_id
 
         except Exception as e:
-            self.logger.error(f"데스크톱 전환 처리 중 오류: {str(e)}")
+            self.logger.error("데스크톱 전환 처리 중 오류: %s", e)
 
     def _handle_immediate_window_move(self) -> None:
         """즉시 고정된 창들을 현재 데스크톱으로 이동 (Win+Ctrl+Down)"""
@@ -200,27 +320,22 @@ class VirtualDesktopController:
                 self.logger.info("고정된 창이 없어 이동할 창이 없음")
                 return
 
-            self.logger.info(f"고정된 창 {len(pinned_windows)}개를 현재 데스크톱으로 즉시 이동")
+            self.logger.info("고정된 창 %s개를 현재 데스크톱으로 즉시 이동", len(pinned_windows))
 
             # 고정된 창들을 현재 데스크톱으로 이동
             moved_count = self.window_manager.move_pinned_windows_to_current_desktop()
 
             if moved_count > 0:
-                self.logger.info(f"고정된 창 {moved_count}개를 현재 데스크톱으로 이동 완료")
+                self.logger.info("고정된 창 %s개를 현재 데스크톱으로 이동 완료", moved_count)
             else:
                 self.logger.warning("고정된 창 이동에 실패했습니다")
 
         except Exception as e:
-            self.logger.error(f"즉시 창 이동 처리 중 오류: {str(e)}")
+            self.logger.error("즉시 창 이동 처리 중 오류: %s", e)
 
     def _handle_center_window(self) -> None:
         """포커스 창을 메인 모니터 중앙으로 이동 및 크기 조정 (Win+Ctrl+Alt+Down)"""
         try:
-            import win32gui
-            import win32con
-
-            self.logger.info("포커스 창 중앙 이동 요청 (Win+Ctrl+Alt+Down)")
-
             # 현재 포커스 창 가져오기
             hwnd = win32gui.GetForegroundWindow()
             if not hwnd:
@@ -228,32 +343,32 @@ class VirtualDesktopController:
                 return
 
             # 창 정보 가져오기
-            from .windows_api import WindowsAPIWrapper
-            api = WindowsAPIWrapper()
-            window_info = api.get_window_info(hwnd)
+            window_info = self.api.get_window_info(hwnd)
 
             if not window_info:
-                self.logger.warning(f"창 정보를 가져올 수 없음 (hwnd: {hwnd})")
+                self.logger.warning("창 정보를 가져올 수 없음 (hwnd: %s)", hwnd)
                 return
 
-            self.logger.info(f"포커스 창: {window_info.title} (hwnd: {hwnd})")
-
             # 메인 모니터 정보 가져오기
             primary_monitor = self.monitor_manager.get_primary_monitor()
             if not primary_monitor:
                 self.logger.error("메인 모니터를 찾을 수 없음")
                 return
 
-            # 목표 크기
-            target_width = 1500
-            target_height = 1392
-
-            # 메인 모니터 중앙 좌표 계산
-            center_x = primary_monitor.x + (primary_monitor.width - target_width) // 2
-            center_y = primary_monitor.y + (primary_monitor.height - target_height) // 2
-
-            self.logger.info(f"메인 모니터: {primary_monitor.width}x{primary_monitor.height} at ({primary_monitor.x}, {primary_monitor.y})")
-            self.logger.info(f"목표 위치: ({center_x}, {center_y}), 크기: {target_width}x{target_height}")
+            # 메인 모니터 중앙 좌표 (모니터 구성이 바뀌면 MonitorInfo 객체가 새로 만들어짐)
+            if primary_monitor is not self._center_monitor:
+                target_width, target_height = CENTER_WINDOW_SIZE
+                self._center_geometry = (
+                    primary_monitor.x + (primary_monitor.width - target_width) // 2,
+                    primary_monitor.y + (primary_monitor.height - target_height) // 2,
+                    target_width,
+                    target_height,
+                )
+                self._center_monitor = primary_monitor
+            center_x, center_y, target_width, target_height = self._center_geometry
+
+            self.logger.debug("포커스 창 중앙 이동: '%s' (hwnd: %s) -> (%s, %s), 크기: %sx%s",
+                              window_info.title, hwnd, center_x, center_y, target_width, target_height)
 
             # 창이 최소화되어 있으면 복원
             if window_info.state == window_info.state.MINIMIZED:
@@ -272,22 +387,22 @@ class VirtualDesktopController:
             )
 
             if result:
-                self.logger.info(f"창을 메인 모니터 중앙으로 이동 완료: '{window_info.title}'")
+                self.logger.info("창을 메인 모니터 중앙으로 이동 완료: '%s'", window_info.title)
             else:
-                self.logger.warning(f"창 이동 실패: '{window_info.title}'")
+                self.logger.warning("창 이동 실패: '%s'", window_info.title)
 
         except Exception as e:
-            self.logger.error(f"포커스 창 중앙 이동 처리 중 오류: {str(e)}")
+            self.logger.error("포커스 창 중앙 이동 처리 중 오류: %s", e)
 
     def set_target_monitor(self, monitor_index: int) -> bool:
         """대상 모니터 변경"""
         monitor = self.monitor_manager.get_monitor_by_index(monitor_index)
         if monitor:
             self.target_monitor_index = monitor_index
-            self.logger.info(f"대상 모니터 변경: {monitor_index}")
+            self.logger.info("대상 모니터 변경: %s", monitor_index)
             return True
         else:
-            self.logger.warning(f"유효하지 않은 모니터 인덱스: {monitor_index}")
+            self.logger.warning("유효하지 않은 모니터 인덱스: %s", monitor_index)
             return False
 
     def is_enabled(self) -> bool:
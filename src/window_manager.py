@@ -1,10 +1,16 @@
 """
 창 관리 시스템 - 최소 기능 구현
 """
-from typing import List, Optional, Dict
+import time
+import win32gui
+from typing import List, Dict, Tuple
 from .models import WindowInfo
-from .windows_api import WindowsAPIWrapper
+from .windows_api import WindowsAPIWrapper, WinEventHook, EVENT_OBJECT_DESTROY
 from .logger import get_logger
+from .error_handler import get_resource_manager
+
+# 창 정보 캐시 유지 시간 (초) - 한 번의 핫키 처리 안에서 반복 조회 공유
+INFO_CACHE_TTL = 0.2
 
 
 class WindowManager:
@@ -14,22 +20,55 @@ class WindowManager:
         self.logger = get_logger("WindowManager")
         self.api = WindowsAPIWrapper()
         self._window_states: Dict[int, tuple] = {}  # hwnd -> placement_data
+        self._info_cache: Dict[int, Tuple[float, WindowInfo]] = {}  # hwnd -> (조회 시각, 창 정보)
+
+        # 창이 파괴되면 저장된 상태를 바로 제거 (복원 시 창마다 유효성 검사 생략)
+        # 상태를 저장하기 전에 시작해야 파괴 이벤트를 놓치지 않음 - 시작 실패 시 복원 때 유효성 검사
+        self._destroy_hook = WinEventHook((EVENT_OBJECT_DESTROY,), self._on_window_destroyed,
+                                          name="WindowDestroyHook")
+        if self._destroy_hook.start():
+            get_resource_manager().register_cleanup(self._destroy_hook.stop, "WindowManager.destroy_hook")
+        else:
+            self.logger.warning("창 파괴 이벤트 후크 시작 실패 - 복원 시 창 유효성 검사로 대체")
+
+    def _on_window_destroyed(self, event: int, hwnd: int) -> None:
+        """창 파괴 이벤트 처리 (후크 스레드)"""
+        if self._window_states.pop(hwnd, None) is not None:
+            self.logger.debug("파괴된 창 상태 제거: %s", hwnd)
 
     def get_visible_windows(self) -> List[WindowInfo]:
         """보이는 창 목록 반환"""
         windows = []
         try:
             handles = self.api.enum_windows()
+
+            # 최근에 조회한 창 정보는 재사용 (현재 열거된 보이는 창만 캐시에 남김)
+            now = time.monotonic()
+            old_cache = self._info_cache
+            cache = {}
             for hwnd in handles:
-                window_info = self.api.get_window_info(hwnd)
-                if window_info and window_info.is_visible and window_info.title.strip():
+                # enum_windows는 숨겨진 창도 반환하므로 창 정보 조회 전에 가시성만 먼저 확인
+                if not win32gui.IsWindowVisible(hwnd):
+                    continue
+
+                entry = old_cache.get(hwnd)
+                if entry is None or now - entry[0] >= INFO_CACHE_TTL:
+                    window_info = self.api.get_window_info(hwnd)
+                    if window_info is None:
+                        continue
+                    entry = (now, window_info)
+                cache[hwnd] = entry
+
+                window_info = entry[1]
+                if window_info.title.strip():
                     windows.append(window_info)
+            self._info_cache = cache
 
-            self.logger.debug(f"보이는 창 {len(windows)}개 수집")
+            self.logger.debug("보이는 창 %s개 수집", len(windows))
             return windows
 
         except Exception as e:
-            self.logger.error(f"창 목록 수집 실패: {str(e)}")
+            self.logger.error("창 목록 수집 실패: %s", e)
             return []
 
     def get_windows_on_monitor(self, monitor_handle: int) -> List[WindowInfo]:
@@ -40,32 +79,31 @@ class WindowManager:
     def save_window_state(self, hwnd: int) -> bool:
         """창 상태 저장"""
         try:
-            import win32gui
             placement = win32gui.GetWindowPlacement(hwnd)
             self._window_states[hwnd] = placement
-            self.logger.debug(f"창 상태 저장: {hwnd}")
+            self.logger.debug("창 상태 저장: %s", hwnd)
             return True
         except Exception as e:
-            self.logger.error(f"창 상태 저장 실패 (hwnd: {hwnd}): {str(e)}")
+            self.logger.error("창 상태 저장 실패 (hwnd: %s): %s", hwnd, e)
             return False
 
     def restore_window_state(self, hwnd: int) -> bool:
         """창 상태 복원"""
         if hwnd not in self._window_states:
-            self.logger.debug(f"창 상태 없음 (hwnd: {hwnd})")
+            self.logger.debug("창 상태 없음 (hwnd: %s)", hwnd)
             return False
 
         try:
             placement = self._window_states[hwnd]
-            self.logger.debug(f"창 복원 시도 (hwnd: {hwnd}), placement: {placement}")
+            self.logger.debug("창 복원 시도 (hwnd: %s), placement: %s", hwnd, placement)
             result = self.api.restore_window_placement(hwnd, placement)
             if result:
-                self.logger.debug(f"창 복원 API 성공 (hwnd: {hwnd})")
+                self.logger.debug("창 복원 API 성공 (hwnd: %s)", hwnd)
             else:
-                self.logger.debug(f"창 복원 API 실패 (hwnd: {hwnd})")
+                self.logger.debug("창 복원 API 실패 (hwnd: %s)", hwnd)
             return result
         except Exception as e:
-            self.logger.error(f"창 상태 복원 실패 (hwnd: {hwnd}): {str(e)}")
+            self.logger.error("창 상태 복원 실패 (hwnd: %s): %s", hwnd, e)
             return False
 
     def save_monitor_windows(self, monitor_handle: int) -> int:
@@ -77,22 +115,24 @@ class WindowManager:
             if self.save_window_state(window.hwnd):
                 saved_count += 1
 
-        self.logger.info(f"모니터 {monitor_handle}의 창 {saved_count}개 상태 저장")
+        self.logger.info("모니터 %s의 창 %s개 상태 저장", monitor_handle, saved_count)
         return saved_count
 
     def restore_monitor_windows(self, monitor_handle: int) -> int:
         """모니터의 모든 창 상태 복원"""
-        restored_count = 0
-
-        # 저장된 모든 창 상태를 복원 시도
-        for hwnd in list(self._window_states.keys()):
-            if self.api.is_window_valid(hwnd):
-                # 가상 데스크톱 전환 후에는 모니터 체크 없이 복원 시도
-                if self.restore_window_state(hwnd):
-                    restored_count += 1
-                    self.logger.debug(f"창 복원 성공: {hwnd}")
-                else:
-                    self.logger.debug(f"창 복원 실패: {hwnd}")
-
-        self.logger.info(f"모니터 {monitor_handle}의 창 {restored_count}개 상태 복원")
+        # 파괴된 창은 후크가 이미 제거했으므로 후크 동작 중에는 유효성 검사 생략
+        check_valid = not self._destroy_hook.is_running()
+
+        # 저장된 모든 창 상태를 한 번에 복원 (가상 데스크톱 전환 후에는 모니터 체크 없이 복원 시도)
+        targets = []
+        for hwnd, placement in list(self._window_states.items()):
+            if not check_valid or self.api.is_window_valid(hwnd):
+                targets.append((hwnd, placement))
+            else:
+                # 파괴된 창의 저장 상태는 제거
+                self._window_states.pop(hwnd, None)
+                self.logger.debug("파괴된 창 상태 제거: %s", hwnd)
+        restored_count = self.api.restore_window_placements(targets)
+
+        self.logger.info("모니터 %s의 창 %s개 상태 복원", monitor_handle, restored_count)
         return restored_count
\ No newline at end of file
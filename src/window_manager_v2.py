@@ -1,48 +1,113 @@
 """
 창 관리 시스템 - 가상 데스크톱 지원 버전
 """
+import re
 import threading
 import time
-import ctypes
-from ctypes import wintypes
-from typing import List, Optional, Dict, Set
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Tuple, FrozenSet, Iterable, Any
+import win32api
+import win32con
+import win32event
+import win32gui
 from .models import WindowInfo
-from .windows_api import WindowsAPIWrapper
+from .windows_api import (WindowsAPIWrapper, WinEventHook, EVENT_SYSTEM_FOREGROUND, EVENT_OBJECT_CREATE,
+                          EVENT_OBJECT_DESTROY, EVENT_OBJECT_SHOW, EVENT_OBJECT_HIDE,
+                          EVENT_OBJECT_LOCATIONCHANGE, SYSTEM_WINDOW_TITLES, HAVE_COMTYPES,
+                          DWM_CLOAKED_SHELL)
 from .logger import get_logger
 
+# 창 이동 단계 사이에 창이 메시지를 처리할 때까지 기다리는 최대 시간 (밀리초)
+_SYNC_TIMEOUT_MS = 200
+
+# 같은 창의 연속 이벤트(드래그 중 위치 변경 등)를 모아 한 번만 판정하기 위한 대기 시간 (초)
+_EVENT_DEBOUNCE_S = 0.1
+
+# 개별 창 동시 이동 최대 작업자 수
+MAX_MOVE_WORKERS = 4
+
+# 서브모니터 창 목록 갱신에 쓰는 WinEvent (창 생성/파괴/표시/숨김/이동, 포어그라운드 변경)
+_TRACKED_EVENTS = (
+    EVENT_OBJECT_CREATE, EVENT_OBJECT_DESTROY, EVENT_OBJECT_SHOW, EVENT_OBJECT_HIDE,
+    EVENT_OBJECT_LOCATIONCHANGE, EVENT_SYSTEM_FOREGROUND,
+)
+
+
+def _keyword_pattern(keywords: Iterable[str]) -> 're.Pattern':
+    """제외 키워드 목록을 대소문자 무시 정규식 하나로 컴파일 (목록이 비면 아무것도 매치하지 않음)"""
+    keywords = list(keywords)
+    if not keywords:
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(map(re.escape, keywords)), re.I)
+
 
 class VirtualDesktopWindowManager:
     """가상 데스크톱 지원 창 관리 클래스"""
 
-    def __init__(self, monitor_manager=None, monitor_interval: float = 2.0):
+    # 전체화면 창 판정에서 제외할 창 제목과 키워드 (최소화된 Notepad++ 제외)
+    _EXCLUDED_TITLES = SYSTEM_WINDOW_TITLES | {''}
+    _EXCLUDED_KW_RE = _keyword_pattern(('notepad++',))
+
+    def __init__(self, monitor_manager=None, monitor_interval: float = 2.0,
+                 min_interval: float = 0.5, max_interval: float = 30.0, track_fullscreen: bool = True,
+                 config: Optional[Dict[str, Any]] = None):
+        """config 키 (생성 시 한 번만 읽음): monitor_interval, idle_backoff_max, excluded_titles,
+        excluded_keywords, secondary_bounds_override ((left, top, right, bottom))"""
         self.logger = get_logger("VirtualDesktopWindowManager")
         self.api = WindowsAPIWrapper()
 
+        config = config or {}
+        monitor_interval = config.get('monitor_interval', monitor_interval)
+        max_interval = config.get('idle_backoff_max', max_interval)
+        if 'excluded_titles' in config:
+            self._EXCLUDED_TITLES = frozenset(config['excluded_titles']) | {''}
+        if 'excluded_keywords' in config:
+            self._EXCLUDED_KW_RE = _keyword_pattern(config['excluded_keywords'])
+
         # 모니터 정보
         from .monitor_manager import MonitorManager
         self.monitor_manager = monitor_manager or MonitorManager()
-        self._secondary_monitor_bounds = self._get_secondary_monitor_bounds()
+        bounds_override = config.get('secondary_bounds_override')
+        self._bounds_fixed = bool(bounds_override)  # 설정값으로 고정된 경계는 모니터 변경 시에도 유지
+        if bounds_override:
+            self._secondary_monitor_bounds = tuple(bounds_override)
+            self.logger.info(f"서브모니터 경계 (설정값): {self._secondary_monitor_bounds}")
+        else:
+            self._secondary_monitor_bounds = self._get_secondary_monitor_bounds()
+        self.monitor_manager.add_change_listener(self._on_monitors_changed)
+        self._track_fullscreen = track_fullscreen  # -32000 좌표(전체화면) 창도 서브모니터 창으로 취급할지 여부
 
         # 창 상태 추적
-        self._secondary_monitor_windows: Set[int] = set()  # 서브모니터의 창들
+        # 서브모니터의 창들 - 항상 새 frozenset으로 교체하므로 읽을 때는 잠금 불필요
+        self._secondary_monitor_windows: FrozenSet[int] = frozenset()
+        self._windows_lock = threading.Lock()  # 후크 스레드와 전체 스캔의 교체 직렬화
+        self._scan_lock = threading.Lock()  # 전체 스캔 직렬화 (주기 스캔/강제 새로고침/모니터 변경 스캔이 겹치지 않도록)
+        self._scan_updates: Optional[Dict[int, bool]] = None  # 전체 스캔 중 후크가 판정한 창 (hwnd -> 서브모니터 여부)
+        self._wi_cache: Dict[int, Tuple[tuple, WindowInfo]] = {}  # 전체 스캔용 창 정보 캐시 (hwnd -> (변경 토큰, 창 정보))
         self._monitoring = False
         self._monitor_thread: Optional[threading.Thread] = None
-        self._monitor_interval = monitor_interval
+        self._monitor_interval = monitor_interval  # 기본 스캔 간격 (변경 감지 시 이 값으로 복귀)
+        self._min_interval = min_interval  # 스캔 종료 후 최소 대기 시간
+        self._max_interval = max_interval  # 변경 없을 때 늘어나는 대기 시간의 상한
         self._stop_event = threading.Event()
+        self._activation_lock = threading.Lock()  # 동시 이동 시 활성화(포어그라운드/최소화/복원)는 한 창씩
+
+        # 창 변경 이벤트 후크 (사용할 수 없으면 주기적 전체 스캔으로 대체)
+        self._event_hook = WinEventHook(_TRACKED_EVENTS, self._on_win_event, name="SecondaryWindowHook")
+        self._pending: Dict[int, float] = {}  # 판정 대기 중인 창 (hwnd -> 판정 시각, monotonic)
+        self._pending_cond = threading.Condition()  # 판정 시각 도래/새 항목 알림 (디바운스 스레드 하나가 처리)
 
         # 가상 데스크톱 API 초기화
         self._init_virtual_desktop_api()
 
     def _init_virtual_desktop_api(self):
         """가상 데스크톱 API 초기화"""
-        try:
-            # Windows 10/11 가상 데스크톱 COM 인터페이스
-            import comtypes.client
-            self._vd_manager = None
+        # Windows 10/11 가상 데스크톱 COM 인터페이스 (comtypes 임포트는 windows_api에서 한 번만 시도)
+        self._vd_manager = None
+        if HAVE_COMTYPES:
             self.logger.info("가상 데스크톱 API 초기화 시도")
-        except Exception as e:
-            self.logger.warning(f"가상 데스크톱 API 초기화 실패: {str(e)}")
-            self._vd_manager = None
+        else:
+            self.logger.warning("가상 데스크톱 API 초기화 실패: comtypes를 사용할 수 없음")
 
     def _get_secondary_monitor_bounds(self):
         """서브모니터 경계 계산"""
@@ -60,6 +125,23 @@ class VirtualDesktopWindowManager:
             self.logger.error(f"서브모니터 경계 계산 실패: {str(e)}")
             return None
 
+    def _on_monitors_changed(self) -> None:
+        """모니터 연결/해제/배치 변경 시 서브모니터 경계를 다시 계산하고 창 목록 재스캔"""
+        if self._bounds_fixed:
+            return
+
+        bounds = self._get_secondary_monitor_bounds()
+        if bounds == self._secondary_monitor_bounds:
+            return
+
+        self._secondary_monitor_bounds = bounds
+        if self._monitoring:
+            self._update_secondary_monitor_windows()
+
+    def _has_nothing_to_track(self) -> bool:
+        """서브모니터가 없고 전체화면 창 추적도 꺼져 있어 판정할 창이 없는지 확인"""
+        return self._secondary_monitor_bounds is None and not self._track_fullscreen
+
     def _is_window_in_secondary_monitor(self, x: int, y: int) -> bool:
         """창이 서브모니터에 있는지 확인"""
         if not self._secondary_monitor_bounds:
@@ -74,7 +156,18 @@ class VirtualDesktopWindowManager:
             return True
 
         try:
+            # 시작 시 한 번 전체 스캔 후 이후 변경은 이벤트로 반영
+            self._update_secondary_monitor_windows()
             self._stop_event.clear()
+            if self._event_hook.start():
+                # 이벤트 판정은 디바운스 스레드 하나가 판정 시각 순서로 처리
+                self._monitor_thread = threading.Thread(target=self._debounce_worker,
+                                                        name="SecondaryWindowDebounce", daemon=True)
+                self._monitor_thread.start()
+                self._monitoring = True
+                self.logger.info("창 모니터링 시작 (이벤트 기반)")
+                return True
+
             self._monitor_thread = threading.Thread(target=self._monitor_worker, daemon=True)
             self._monitor_thread.start()
             self._monitoring = True
@@ -87,81 +180,210 @@ class VirtualDesktopWindowManager:
     def stop_monitoring(self):
         """창 모니터링 중지"""
         if self._monitoring:
+            self._event_hook.stop()
             self._stop_event.set()
+            with self._pending_cond:
+                self._pending.clear()
+                self._pending_cond.notify()
             if self._monitor_thread:
                 self._monitor_thread.join(timeout=2.0)
+                self._monitor_thread = None
             self._monitoring = False
             self.logger.info("창 모니터링 중지")
 
     def _monitor_worker(self):
-        """창 모니터링 워커 스레드"""
+        """창 모니터링 워커 스레드 (스캔 종료 기준 간격, 변경 없으면 간격을 두 배씩 늘림)"""
+        interval = self._monitor_interval
         while not self._stop_event.is_set():
+            started = time.perf_counter()
+            changed = True
             try:
-                self._update_secondary_monitor_windows()
+                changed = self._update_secondary_monitor_windows()
             except Exception as e:
                 self.logger.error(f"창 모니터링 중 오류: {str(e)}")
 
-            # 인터럽트 가능한 대기
-            self._stop_event.wait(self._monitor_interval)
-
-    def _update_secondary_monitor_windows(self):
-        """서브모니터의 창 목록 업데이트"""
+            if changed:
+                interval = self._monitor_interval
+            else:
+                interval = min(interval * 2, self._max_interval)
+
+            # 스캔에 걸린 시간을 빼고 대기 (인터럽트 가능)
+            delay = max(self._min_interval, interval - (time.perf_counter() - started))
+            self._stop_event.wait(delay)
+
+    def _on_win_event(self, event: int, hwnd: int) -> None:
+        """창 변경 이벤트 처리 (후크 스레드) - 파괴는 즉시, 나머지는 잠잠해진 뒤 한 번만 판정"""
+        if event == EVENT_OBJECT_DESTROY:
+            with self._pending_cond:
+                self._pending.pop(hwnd, None)
+            self._recompute_one(hwnd, destroyed=True)
+            return
+
+        # 이미 대기 중인 창은 판정 시각만 미룸 (새 창일 때만 디바운스 스레드를 깨움)
+        with self._pending_cond:
+            is_new = hwnd not in self._pending
+            self._pending[hwnd] = time.monotonic() + _EVENT_DEBOUNCE_S
+            if is_new:
+                self._pending_cond.notify()
+
+    def _debounce_worker(self) -> None:
+        """판정 시각이 지난 창들을 꺼내 판정 (가장 이른 판정 시각까지 대기)"""
+        while True:
+            with self._pending_cond:
+                # 중지 요청은 잠금 안에서 확인 (stop_monitoring이 설정 후 notify하므로 알림 누락 없음)
+                if self._stop_event.is_set():
+                    return
+                if not self._pending:
+                    self._pending_cond.wait()
+                    continue
+
+                now = time.monotonic()
+                due = [hwnd for hwnd, deadline in self._pending.items() if deadline <= now]
+                if not due:
+                    self._pending_cond.wait(min(self._pending.values()) - now)
+                    continue
+                for hwnd in due:
+                    del self._pending[hwnd]
+
+            for hwnd in due:
+                try:
+                    self._recompute_one(hwnd)
+                except Exception as e:
+                    self.logger.error(f"창 판정 중 오류 (hwnd: {hwnd}): {str(e)}")
+
+    def _recompute_one(self, hwnd: int, destroyed: bool = False) -> None:
+        """창 하나의 서브모니터 창 여부를 다시 판정해 목록에 반영"""
+        if destroyed or self._has_nothing_to_track():
+            is_secondary = False
+        elif not self.api.is_top_level_window(hwnd):
+            return  # 자식 컨트롤 이벤트 - 전체 스캔(EnumWindows)과 같게 최상위 창만 대상
+        elif not self.api.is_visible_titled_window(hwnd):
+            is_secondary = False
+        else:
+            window_info = self.api.get_window_info(hwnd)
+            bounds = self._secondary_monitor_bounds or (0, 0, 0, 0)
+            is_secondary = window_info is not None and self._is_secondary_window(hwnd, window_info, bounds)
+
+        with self._windows_lock:
+            # 진행 중인 전체 스캔이 있으면 교체 시 이 판정이 덮어써지지 않도록 기록
+            if self._scan_updates is not None:
+                self._scan_updates[hwnd] = is_secondary
+
+            windows = self._secondary_monitor_windows
+            if is_secondary:
+                if hwnd not in windows:
+                    self._secondary_monitor_windows = windows | {hwnd}
+                    self.logger.debug(f"서브모니터 창 추가: {hwnd}")
+            elif hwnd in windows:
+                self._secondary_monitor_windows = windows - {hwnd}
+                self.logger.debug(f"서브모니터 창 제거: {hwnd}")
+
+    def _update_secondary_monitor_windows(self) -> bool:
+        """서브모니터의 창 목록 업데이트 (목록이 바뀌었으면 True)"""
+        # _scan_updates와 _wi_cache는 스캔 하나만 사용하도록 전체 스캔을 한 번에 하나씩 실행
+        with self._scan_lock:
+            return self._scan_secondary_monitor_windows()
+
+    def _scan_secondary_monitor_windows(self) -> bool:
+        """전체 스캔 본체 (_scan_lock을 잡은 상태에서 호출)"""
         try:
+            if self._has_nothing_to_track():
+                # 서브모니터가 없으면 창을 열거할 필요 없음
+                with self._windows_lock:
+                    changed = bool(self._secondary_monitor_windows)
+                    self._secondary_monitor_windows = frozenset()
+                return changed
+
+            with self._windows_lock:
+                self._scan_updates = {}
+
             current_windows = set()
-            total_windows = 0
             visible_windows = 0
 
-            # 모든 보이는 창 확인
-            windows = self.api.enum_windows()
-            total_windows = len(windows)
+            # 서브모니터 경계는 스캔마다 한 번만 읽음 (서브모니터가 없으면 빈 영역)
+            bounds = self._secondary_monitor_bounds or (0, 0, 0, 0)
+
+            # 보이고 제목이 있는 창만 열거 단계에서 걸러서 확인
+            windows = self.api.enum_visible_titled_windows()
 
             for hwnd in windows:
-                window_info = self.api.get_window_info(hwnd)
+                window_info = self.api.get_window_info_cached(hwnd, self._wi_cache)
                 if window_info and window_info.is_visible and window_info.title.strip():
                     visible_windows += 1
-                    self.logger.debug(f"창 감지: {hwnd} '{window_info.title}' 위치=({window_info.x},{window_info.y})")
-
-                    # 서브모니터에 있는 창인지 확인
-                    is_secondary = False
-
-                    # 1. 실제 서브모니터 경계 확인 (여유를 두어 300 <= x < 2300, -1100 <= y < 100)
-                    if (300 <= window_info.x < 2300 and -1100 <= window_info.y < 100):
-                        is_secondary = True
-                        self.logger.debug(f"서브모니터 창 (경계내): {hwnd} '{window_info.title}'")
-
-                    # 2. 전체화면 창 감지 (-32000 좌표는 특별 처리)
-                    elif window_info.x == -32000 and window_info.y == -32000:
-                        # 창 상태 확인 - 최소화된 창은 제외
-                        if window_info.state != window_info.state.MINIMIZED and window_info.title.strip():
-                            # 시스템 창이나 숨겨진 창 제외
-                            excluded_titles = ['', 'Program Manager', 'Windows 입력 환경', 'Desktop Window Manager']
-                            excluded_keywords = ['notepad++']  # 최소화된 Notepad++ 제외
-
-                            title_lower = window_info.title.lower()
-                            if (window_info.title not in excluded_titles and
-                                not any(keyword in title_lower for keyword in excluded_keywords)):
-                                is_secondary = True
-                                self.logger.debug(f"서브모니터 창 (전체화면): {hwnd} '{window_info.title}'")
+                    if self._is_secondary_window(hwnd, window_info, bounds):
+                        current_windows.add(hwnd)
+
+            # 더 이상 존재하지 않는 창은 캐시에서 제거
+            stale = self._wi_cache.keys() - set(windows)
+            for hwnd in stale:
+                del self._wi_cache[hwnd]
 
+            self.logger.debug(f"창 스캔 결과: 후보={len(windows)}, 보이는창={visible_windows}, 서브모니터={len(current_windows)}")
+
+            with self._windows_lock:
+                # 스캔 도중 후크가 판정한 창은 더 최신이므로 스캔 결과보다 우선
+                for hwnd, is_secondary in self._scan_updates.items():
                     if is_secondary:
                         current_windows.add(hwnd)
+                    else:
+                        current_windows.discard(hwnd)
+                self._scan_updates = None
 
-            self.logger.debug(f"창 스캔 결과: 전체={total_windows}, 보이는창={visible_windows}, 서브모니터={len(current_windows)}")
+                # 변경이 없으면 (대부분의 경우) 차집합을 만들지 않음
+                previous = self._secondary_monitor_windows
+                if current_windows == previous:
+                    return False
+                self._secondary_monitor_windows = frozenset(current_windows)
 
             # 새로 추가된 창들 로깅
-            new_windows = current_windows - self._secondary_monitor_windows
-            if new_windows:
-                self.logger.info(f"서브모니터에 새 창 감지: {len(new_windows)}개")
+            new_count = sum(1 for hwnd in current_windows if hwnd not in previous)
+            if new_count:
+                self.logger.info(f"서브모니터에 새 창 감지: {new_count}개")
 
             # 제거된 창들 로깅
-            removed_windows = self._secondary_monitor_windows - current_windows
-            if removed_windows:
-                self.logger.info(f"서브모니터에서 창 제거: {len(removed_windows)}개")
+            removed_count = sum(1 for hwnd in previous if hwnd not in current_windows)
+            if removed_count:
+                self.logger.info(f"서브모니터에서 창 제거: {removed_count}개")
 
-            self._secondary_monitor_windows = current_windows
+            return True
 
         except Exception as e:
+            with self._windows_lock:
+                self._scan_updates = None
             self.logger.error(f"서브모니터 창 업데이트 실패: {str(e)}")
+            return True
+
+    def _is_secondary_window(self, hwnd: int, window_info: WindowInfo,
+                             bounds: Tuple[int, int, int, int]) -> bool:
+        """서브모니터에 있는 창인지 판정 (보이고 제목이 있는 창만 대상, bounds는 left/top/right/bottom)"""
+        if not (window_info.is_visible and window_info.title.strip()):
+            return False
+
+        # 앱이 스스로 숨긴 창 (일시 중단된 UWP 창 등)은 실제로 보이는 창이 아님
+        cloaked = window_info.cloaked
+        if cloaked and cloaked != DWM_CLOAKED_SHELL:
+            return False
+
+        x, y = window_info.x, window_info.y
+        self.logger.debug(f"창 감지: {hwnd} '{window_info.title}' 위치=({x},{y}) cloaked={cloaked}")
+
+        # 1. 서브모니터 경계 확인 (다른 가상 데스크톱에 있어 셸이 숨긴 창도 실제 위치를 유지하므로 같은 기준)
+        left, top, right, bottom = bounds
+        if left <= x < right and top <= y < bottom:
+            self.logger.debug(f"서브모니터 창 (경계내): {hwnd} '{window_info.title}'")
+            return True
+
+        # 2. 전체화면 창 감지 (-32000 좌표는 특별 처리) - DWM 숨김 상태로 판별되지 않는 현재 데스크톱 창만
+        if self._track_fullscreen and not cloaked and x == -32000 and y == -32000:
+            # 창 상태 확인 - 최소화된 창은 제외
+            if window_info.state != window_info.state.MINIMIZED:
+                # 시스템 창이나 숨겨진 창 제외
+                title = window_info.title
+                if title not in self._EXCLUDED_TITLES and not self._EXCLUDED_KW_RE.search(title):
+                    self.logger.debug(f"서브모니터 창 (전체화면): {hwnd} '{window_info.title}'")
+                    return True
+
+        return False
 
     def get_secondary_monitor_windows(self) -> List[int]:
         """현재 서브모니터에 있는 창 목록 반환"""
@@ -175,12 +397,9 @@ class VirtualDesktopWindowManager:
             secondary_windows = self.get_secondary_monitor_windows()
             self.logger.info(f"서브모니터 창 {len(secondary_windows)}개를 현재 데스크톱으로 이동 시도")
 
-            for hwnd in secondary_windows:
-                if self._move_window_to_current_desktop(hwnd):
-                    moved_count += 1
-                    self.logger.debug(f"창 이동 성공: {hwnd}")
-                else:
-                    self.logger.debug(f"창 이동 실패: {hwnd}")
+            # 창별 이동 절차(숨김/표시, 활성화, 최소화/복원)를 그대로 유지하되 여러 창은 동시에 처리
+            if secondary_windows:
+                moved_count = self._move_windows_individually(secondary_windows)
 
             self.logger.info(f"총 {moved_count}개 창을 현재 데스크톱으로 이동")
             return moved_count
@@ -189,18 +408,48 @@ class VirtualDesktopWindowManager:
             self.logger.error(f"창 이동 중 오류: {str(e)}")
             return moved_count
 
+    def _move_windows_individually(self, hwnds: List[int]) -> int:
+        """창들을 하나씩 이동 (여러 개면 숨김/표시와 대기 시간이 겹치도록 동시에), 이동된 창 개수 반환"""
+        if len(hwnds) == 1:
+            return int(self._move_window_to_current_desktop(hwnds[0]))
+
+        workers = min(len(hwnds), MAX_MOVE_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="vd-move") as pool:
+            return sum(pool.map(self._move_window_to_current_desktop, hwnds))
+
+    def _open_process(self, process_id: int):
+        """WaitForInputIdle용 프로세스 핸들 열기 (실패 시 None)"""
+        try:
+            return win32api.OpenProcess(win32con.PROCESS_QUERY_INFORMATION | win32con.SYNCHRONIZE,
+                                        False, process_id)
+        except Exception:
+            return None
+
+    def _sync_window(self, hwnd: int, process) -> None:
+        """창이 앞서 보낸 요청을 처리할 때까지 대기 (고정 sleep 대체)"""
+        if process is not None:
+            try:
+                win32event.WaitForInputIdle(process, _SYNC_TIMEOUT_MS)
+            except Exception:
+                pass
+        try:
+            # WM_NULL이 처리되면 앞서 큐에 쌓인 메시지도 처리된 것 (응답 없는 창은 즉시 포기)
+            win32gui.SendMessageTimeout(hwnd, win32con.WM_NULL, 0, 0,
+                                        win32con.SMTO_ABORTIFHUNG, _SYNC_TIMEOUT_MS)
+        except Exception:
+            pass
+
     def _move_window_to_current_desktop(self, hwnd: int) -> bool:
         """개별 창을 현재 가상 데스크톱으로 이동"""
+        process = None
         try:
-            import win32gui
-            import win32con
-
             # 창 정보 확인
             window_info = self.api.get_window_info(hwnd)
             if not window_info:
                 return False
 
             is_fullscreen = (window_info.x == -32000 and window_info.y == -32000)
+            process = self._open_process(window_info.process_id)
 
             if is_fullscreen:
                 self.logger.debug(f"전체화면 창 이동 시도: {hwnd} '{window_info.title}'")
@@ -208,38 +457,40 @@ class VirtualDesktopWindowManager:
                 # 전체화면 창 특별 처리
                 # 1. 전체화면 해제
                 win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                time.sleep(0.2)
+                self._sync_window(hwnd, process)
 
-                # 2. 강제 활성화
-                try:
-                    win32gui.SetForegroundWindow(hwnd)
-                    time.sleep(0.2)
-                except:
-                    pass
+                with self._activation_lock:
+                    # 2. 강제 활성화
+                    try:
+                        win32gui.SetForegroundWindow(hwnd)
+                        self._sync_window(hwnd, process)
+                    except:
+                        pass
 
-                # 3. 다시 전체화면으로
-                win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
+                    # 3. 다시 전체화면으로
+                    win32gui.ShowWindow(hwnd, win32con.SW_MAXIMIZE)
 
             else:
                 self.logger.debug(f"일반 창 이동 시도: {hwnd} '{window_info.title}'")
 
                 # 일반 창 처리
                 win32gui.ShowWindow(hwnd, win32con.SW_HIDE)
-                time.sleep(0.1)
+                self._sync_window(hwnd, process)
                 win32gui.ShowWindow(hwnd, win32con.SW_SHOW)
 
-                try:
-                    win32gui.SetForegroundWindow(hwnd)
-                    time.sleep(0.1)
-                except:
-                    pass
+                with self._activation_lock:
+                    try:
+                        win32gui.SetForegroundWindow(hwnd)
+                        self._sync_window(hwnd, process)
+                    except:
+                        pass
 
-                try:
-                    win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
-                    time.sleep(0.1)
-                    win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
-                except:
-                    pass
+                    try:
+                        win32gui.ShowWindow(hwnd, win32con.SW_MINIMIZE)
+                        self._sync_window(hwnd, process)
+                        win32gui.ShowWindow(hwnd, win32con.SW_RESTORE)
+                    except:
+                        pass
 
             return True
 
@@ -247,8 +498,12 @@ class VirtualDesktopWindowManager:
             self.logger.debug(f"창 이동 실패 (hwnd: {hwnd}): {str(e)}")
             return False
 
+        finally:
+            if process is not None:
+                process.Close()
+
     def force_refresh_secondary_windows(self):
-        """서브모니터 창 목록 강제 새로고침"""
+        """서브모니터 창 목록 강제 새로고침 (전체 스캔 - 시작 시 또는 이벤트 누락 의심 시)"""
         self._update_secondary_monitor_windows()
         count = len(self._secondary_monitor_windows)
         self.logger.info(f"서브모니터 창 새로고침 완료: {count}개")
@@ -256,9 +511,10 @@ class VirtualDesktopWindowManager:
 
     def get_status(self) -> dict:
         """현재 상태 반환"""
+        windows = self._secondary_monitor_windows
         return {
             'monitoring': self._monitoring,
-            'secondary_windows_count': len(self._secondary_monitor_windows),
-            'secondary_windows': list(self._secondary_monitor_windows),
+            'secondary_windows_count': len(windows),
+            'secondary_windows': list(windows),
             'monitor_interval': self._monitor_interval
         }
\ No newline at end of file
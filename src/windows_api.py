@@ -7,13 +7,142 @@ import win32api
 import win32gui
 import win32con
 import win32process
-from typing import List, Tuple, Optional, Callable
+from typing import List, Tuple, Optional, Callable, Dict
 import ctypes
 from ctypes import wintypes
 import logging
+import threading
+
+try:
+    import comtypes
+    from comtypes import GUID, COMMETHOD, HRESULT, IUnknown
+    HAVE_COMTYPES = True
+except ImportError:
+    HAVE_COMTYPES = False
 
 from .models import WindowInfo, WindowState, MonitorInfo
 
+# 창 목록에서 제외할 시스템 창 제목
+SYSTEM_WINDOW_TITLES = frozenset({'Program Manager', 'Windows 입력 환경', 'Desktop Window Manager'})
+
+# WinEvent 후크 상수
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_OBJECT_CREATE = 0x8000
+EVENT_OBJECT_DESTROY = 0x8001
+EVENT_OBJECT_SHOW = 0x8002
+EVENT_OBJECT_HIDE = 0x8003
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+WINEVENT_OUTOFCONTEXT = 0x0000
+WINEVENT_SKIPOWNPROCESS = 0x0002
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WM_QUIT = 0x0012
+SPI_SETWORKAREA = 0x002F
+GA_ROOT = 2
+DWMWA_CLOAKED = 14
+DWM_CLOAKED_APP = 0x1
+DWM_CLOAKED_SHELL = 0x2
+DWM_CLOAKED_INHERITED = 0x4
+
+WinEventProcType = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+                                      wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+
+WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
+
+
+class WINDOWINFO(ctypes.Structure):
+    """GetWindowInfo 결과 구조체 (winuser.h)"""
+    _fields_ = [
+        ('cbSize', wintypes.DWORD),
+        ('rcWindow', wintypes.RECT),
+        ('rcClient', wintypes.RECT),
+        ('dwStyle', wintypes.DWORD),
+        ('dwExStyle', wintypes.DWORD),
+        ('dwWindowStatus', wintypes.DWORD),
+        ('cxWindowBorders', wintypes.UINT),
+        ('cyWindowBorders', wintypes.UINT),
+        ('atomWindowType', wintypes.ATOM),
+        ('wCreatorVersion', wintypes.WORD),
+    ]
+
+
+_GetWindowInfo = ctypes.windll.user32.GetWindowInfo
+_GetWindowInfo.argtypes = (wintypes.HWND, ctypes.POINTER(WINDOWINFO))
+_GetWindowInfo.restype = wintypes.BOOL
+
+_GetAncestor = ctypes.windll.user32.GetAncestor
+_GetAncestor.argtypes = (wintypes.HWND, wintypes.UINT)
+_GetAncestor.restype = wintypes.HWND
+
+_DwmGetWindowAttribute = ctypes.WinDLL('dwmapi').DwmGetWindowAttribute
+_DwmGetWindowAttribute.argtypes = (wintypes.HWND, wintypes.DWORD, ctypes.c_void_p, wintypes.DWORD)
+_DwmGetWindowAttribute.restype = ctypes.c_long  # HRESULT
+
+# get_window_info_cached 변경 토큰에 포함할 스타일 비트 (표시/최소화/최대화)
+_STATE_STYLE_MASK = win32con.WS_VISIBLE | win32con.WS_MINIMIZE | win32con.WS_MAXIMIZE
+
+
+def read_window_info(hwnd: int) -> Optional[WINDOWINFO]:
+    """창 위치/스타일을 GetWindowInfo 한 번으로 조회 (유효하지 않은 창이면 None)"""
+    wi = WINDOWINFO()
+    wi.cbSize = ctypes.sizeof(WINDOWINFO)
+    if not _GetWindowInfo(hwnd, ctypes.byref(wi)):
+        return None
+    return wi
+
+
+def window_cloaked(hwnd: int) -> int:
+    """창의 DWMWA_CLOAKED 값 반환 (숨겨지지 않았거나 조회 실패 시 0)"""
+    cloaked = wintypes.DWORD(0)
+    if _DwmGetWindowAttribute(hwnd, DWMWA_CLOAKED, ctypes.byref(cloaked), ctypes.sizeof(cloaked)) != 0:
+        return 0
+    return cloaked.value
+
+
+# enum_window_handles 첫 열거에 할당할 배열 크기 (가득 차면 두 배로 늘려 다시 열거)
+ENUM_CAPACITY = 1024
+
+
+def enum_window_handles() -> List[int]:
+    """최상위 창 핸들 목록 반환 (콜백은 미리 할당한 배열에 핸들만 기록)"""
+    capacity = ENUM_CAPACITY
+    while True:
+        buf = (wintypes.HWND * capacity)()
+        count = 0
+
+        def enum_proc(hwnd, lparam):
+            nonlocal count
+            buf[count] = hwnd
+            count += 1
+            return count < capacity
+
+        ctypes.windll.user32.EnumWindows(WNDENUMPROC(enum_proc), 0)
+        if count < capacity:
+            return buf[:count]
+
+        # 배열이 가득 차 중간에 멈춘 열거 - 잘린 목록 대신 더 큰 배열로 다시 열거
+        logging.getLogger(__name__).debug("창 핸들 %s개 초과, 배열을 늘려 다시 열거", capacity)
+        capacity *= 2
+
+
+if HAVE_COMTYPES:
+    class IVirtualDesktopManager(IUnknown):
+        """가상 데스크톱 관리자 COM 인터페이스 (shobjidl_core.h)"""
+        _iid_ = GUID('{A5CD92FF-29BE-454C-8D04-D82879FB3F1B}')
+        _methods_ = [
+            COMMETHOD([], HRESULT, 'IsWindowOnCurrentVirtualDesktop',
+                      (['in'], wintypes.HWND, 'topLevelWindow'),
+                      (['out', 'retval'], ctypes.POINTER(wintypes.BOOL), 'onCurrentDesktop')),
+            COMMETHOD([], HRESULT, 'GetWindowDesktopId',
+                      (['in'], wintypes.HWND, 'topLevelWindow'),
+                      (['out', 'retval'], ctypes.POINTER(GUID), 'desktopId')),
+            COMMETHOD([], HRESULT, 'MoveWindowToDesktop',
+                      (['in'], wintypes.HWND, 'topLevelWindow'),
+                      (['in'], ctypes.POINTER(GUID), 'desktopId')),
+        ]
+
+    CLSID_VirtualDesktopManager = GUID('{AA509086-5CA9-4C25-8F95-589D3C07B48A}')
+
 
 class WindowsAPIError(Exception):
     """Windows API 관련 예외 클래스"""
@@ -30,37 +159,56 @@ class WindowsAPIWrapper:
 
     def _handle_win32_error(self, operation: str) -> None:
         """Win32 API 오류를 처리하고 예외로 변환"""
-        try:
-            error_code = win32api.GetLastError()
-            if error_code != 0:
-                error_message = win32api.FormatMessage(error_code)
-                raise WindowsAPIError(
-                    f"{operation} 실패: {error_message.strip()}",
-                    error_code
-                )
-        except Exception as e:
-            raise WindowsAPIError(f"{operation} 중 오류 발생: {str(e)}")
+        error_code = win32api.GetLastError()
+        if error_code != 0:
+            error_message = win32api.FormatMessage(error_code)
+            raise WindowsAPIError(
+                f"{operation} 실패: {error_message.strip()}",
+                error_code
+            )
 
     def enum_windows(self) -> List[int]:
         """모든 최상위 창의 핸들 목록을 반환"""
-        window_handles = []
+        try:
+            return enum_window_handles()
+        except Exception:
+            self._handle_win32_error("창 목록 열거")
+            return []
 
-        def enum_windows_proc(hwnd: int, lparam: int) -> bool:
-            window_handles.append(hwnd)
-            return True
+    def is_top_level_window(self, hwnd: int) -> bool:
+        """최상위 창인지 확인 (자식 컨트롤이면 False)"""
+        return _GetAncestor(hwnd, GA_ROOT) == hwnd
 
+    def is_visible_titled_window(self, hwnd: int) -> bool:
+        """보이고 제목이 있으며 도구 창이 아닌 창인지 확인 (WindowInfo 생성 전 저비용 필터)"""
+        if not win32gui.IsWindowVisible(hwnd):
+            return False
+        if win32gui.GetWindowTextLength(hwnd) == 0:
+            return False
+        ex_style = win32gui.GetWindowLong(hwnd, win32con.GWL_EXSTYLE)
+        return not ex_style & win32con.WS_EX_TOOLWINDOW
+
+    def enum_visible_titled_windows(self) -> List[int]:
+        """보이고 제목이 있는 최상위 창의 핸들 목록을 반환 (도구 창 제외)"""
+        window_handles = []
         try:
-            win32gui.EnumWindows(enum_windows_proc, 0)
+            for hwnd in enum_window_handles():
+                try:
+                    if self.is_visible_titled_window(hwnd):
+                        window_handles.append(hwnd)
+                except Exception:
+                    pass  # 열거 후 파괴된 창
             return window_handles
-        except Exception as e:
+        except Exception:
             self._handle_win32_error("창 목록 열거")
             return []
 
     def get_window_info(self, hwnd: int) -> Optional[WindowInfo]:
         """창 핸들로부터 창 정보를 수집"""
         try:
-            # 창이 유효한지 확인
-            if not win32gui.IsWindow(hwnd):
+            # 창 위치/스타일 한 번에 조회 (유효하지 않은 창이면 실패)
+            wi = read_window_info(hwnd)
+            if wi is None:
                 return None
 
             # 창 제목 가져오기
@@ -72,29 +220,30 @@ class WindowsAPIWrapper:
             # 프로세스 ID 가져오기
             _, process_id = win32process.GetWindowThreadProcessId(hwnd)
 
-            # 창 위치 및 크기 가져오기
-            rect = win32gui.GetWindowRect(hwnd)
-            x, y, right, bottom = rect
-            width = right - x
-            height = bottom - y
-
-            # 창 상태 확인
-            placement = win32gui.GetWindowPlacement(hwnd)
-            show_cmd = placement[1]
+            # 창 위치 및 크기
+            rect = wi.rcWindow
+            x, y = rect.left, rect.top
+            width = rect.right - x
+            height = rect.bottom - y
 
-            if show_cmd == win32con.SW_SHOWMINIMIZED:
+            # 창 상태 확인 (스타일 비트)
+            style = wi.dwStyle
+            if style & win32con.WS_MINIMIZE:
                 state = WindowState.MINIMIZED
-            elif show_cmd == win32con.SW_SHOWMAXIMIZED:
+            elif style & win32con.WS_MAXIMIZE:
                 state = WindowState.MAXIMIZED
             else:
                 state = WindowState.NORMAL
 
-            # 창이 보이는지 확인
-            is_visible = win32gui.IsWindowVisible(hwnd)
+            # 창이 보이는지 확인 (최상위 창은 WS_VISIBLE 비트가 IsWindowVisible 결과와 같음)
+            is_visible = bool(style & win32con.WS_VISIBLE)
 
             # 모니터 핸들 가져오기
             monitor_handle = win32api.MonitorFromWindow(hwnd, win32con.MONITOR_DEFAULTTONEAREST)
 
+            # DWM 숨김 상태 (다른 가상 데스크톱에 있는 창은 셸이 숨김)
+            cloaked = window_cloaked(hwnd)
+
             return WindowInfo(
                 hwnd=hwnd,
                 title=title,
@@ -106,13 +255,40 @@ class WindowsAPIWrapper:
                 height=height,
                 state=state,
                 monitor_handle=monitor_handle,
-                is_visible=is_visible
+                is_visible=is_visible,
+                cloaked=cloaked
             )
 
         except Exception as e:
             self.logger.warning(f"창 정보 수집 실패 (hwnd: {hwnd}): {str(e)}")
             return None
 
+    def get_window_info_cached(self, hwnd: int, cache: Dict[int, Tuple[tuple, WindowInfo]]) -> Optional[WindowInfo]:
+        """창 위치/상태/제목 길이/DWM 숨김 상태가 그대로면 캐시된 창 정보 반환, 바뀌었으면 새로 수집"""
+        try:
+            wi = read_window_info(hwnd)
+            if wi is None:
+                cache.pop(hwnd, None)
+                return None
+
+            rect = wi.rcWindow
+            token = (rect.left, rect.top, rect.right, rect.bottom, wi.dwStyle & _STATE_STYLE_MASK,
+                     win32gui.GetWindowTextLength(hwnd), window_cloaked(hwnd))
+        except Exception as e:
+            self.logger.warning(f"창 정보 수집 실패 (hwnd: {hwnd}): {str(e)}")
+            return None
+
+        entry = cache.get(hwnd)
+        if entry is not None and entry[0] == token:
+            return entry[1]
+
+        window_info = self.get_window_info(hwnd)
+        if window_info is None:
+            cache.pop(hwnd, None)
+        else:
+            cache[hwnd] = (token, window_info)
+        return window_info
+
     def set_window_pos(self, hwnd: int, x: int, y: int, width: int, height: int,
                       flags: int = 0) -> bool:
         """창 위치와 크기를 설정"""
@@ -128,31 +304,71 @@ class WindowsAPIWrapper:
             self.logger.error(f"창 위치 설정 실패 (hwnd: {hwnd}): {str(e)}")
             return False
 
+    def _placement_rect(self, hwnd: int, placement_data: tuple) -> Optional[Tuple[int, int, int, int]]:
+        """배치 정보에서 복원할 창 위치 (x, y, 너비, 높이) 계산 (음수 좌표 보정 포함)"""
+        # placement_data 형식: (flags, showCmd, ptMinPosition, ptMaxPosition, rcNormalPosition)
+        if len(placement_data) < 5:
+            return None
+
+        flags, show_cmd, pt_min, pt_max, rect = placement_data
+        left, top, right, bottom = rect
+
+        # 음수 좌표 보정
+        if left < 0 or top < 0:
+            self.logger.debug(f"음수 좌표 감지, 보정 시도 (hwnd: {hwnd})")
+            # 서브모니터 좌표로 보정 (1920 이후가 서브모니터)
+            if left < 1920:  # 주모니터 영역
+                left = max(1920, left + 1920)  # 서브모니터로 이동
+                right = left + (right - rect[0])
+            top = max(0, top)  # Y 좌표는 0 이상으로
+            bottom = max(top + 100, bottom)  # 최소 높이 보장
+
+        return left, top, right - left, bottom - top
+
+    def restore_window_placements(self, placements: List[Tuple[int, tuple]]) -> int:
+        """여러 창의 배치 정보를 한 번에 복원 (위치 변경은 DeferWindowPos로 묶어 적용), 복원된 창 개수 반환"""
+        restored = 0
+        moves = []
+
+        for hwnd, placement_data in placements:
+            rect = self._placement_rect(hwnd, placement_data)
+            if rect is None:
+                restored += bool(self.restore_window_placement(hwnd, placement_data))
+            else:
+                moves.append((hwnd, placement_data, rect))
+
+        if not moves:
+            return restored
+
+        try:
+            hdwp = win32gui.BeginDeferWindowPos(len(moves))
+            for hwnd, _, (x, y, width, height) in moves:
+                hdwp = win32gui.DeferWindowPos(hdwp, hwnd, 0, x, y, width, height,
+                                               win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE)
+            win32gui.EndDeferWindowPos(hdwp)
+            return restored + len(moves)
+
+        except Exception as e:
+            # 한 창이라도 실패하면 일괄 적용이 취소되므로 창별로 다시 시도
+            self.logger.debug(f"일괄 창 위치 변경 실패, 개별 복원으로 전환: {str(e)}")
+            for hwnd, placement_data, _ in moves:
+                restored += bool(self.restore_window_placement(hwnd, placement_data))
+            return restored
+
     def restore_window_placement(self, hwnd: int, placement_data: tuple) -> bool:
         """창 배치 정보를 복원"""
         try:
             self.logger.debug(f"창 복원 시도 (hwnd: {hwnd}), placement: {placement_data}")
 
             # placement_data에서 창 위치 정보 추출
-            # placement_data 형식: (flags, showCmd, ptMinPosition, ptMaxPosition, rcNormalPosition)
-            if len(placement_data) >= 5:
-                flags, show_cmd, pt_min, pt_max, rect = placement_data
-                left, top, right, bottom = rect
-
-                # 음수 좌표 보정
-                if left < 0 or top < 0:
-                    self.logger.debug(f"음수 좌표 감지, 보정 시도 (hwnd: {hwnd})")
-                    # 서브모니터 좌표로 보정 (1920 이후가 서브모니터)
-                    if left < 1920:  # 주모니터 영역
-                        left = max(1920, left + 1920)  # 서브모니터로 이동
-                        right = left + (right - rect[0])
-                    top = max(0, top)  # Y 좌표는 0 이상으로
-                    bottom = max(top + 100, bottom)  # 최소 높이 보장
+            rect = self._placement_rect(hwnd, placement_data)
+            if rect is not None:
+                x, y, width, height = rect
 
                 # SetWindowPos로 직접 위치 설정
-                self.logger.debug(f"SetWindowPos 호출: hwnd={hwnd}, pos=({left},{top},{right-left},{bottom-top})")
+                self.logger.debug(f"SetWindowPos 호출: hwnd={hwnd}, pos=({x},{y},{width},{height})")
                 result = win32gui.SetWindowPos(
-                    hwnd, 0, left, top, right - left, bottom - top,
+                    hwnd, 0, x, y, width, height,
                     win32con.SWP_NOZORDER | win32con.SWP_NOACTIVATE
                 )
 
@@ -181,9 +397,6 @@ class WindowsAPIWrapper:
 
         try:
             # ctypes를 사용하여 EnumDisplayMonitors 직접 호출
-            import ctypes
-            from ctypes import wintypes
-
             user32 = ctypes.windll.user32
 
             # 콜백 함수 타입 정의
@@ -256,7 +469,7 @@ class WindowsAPIWrapper:
     def show_window(self, hwnd: int, cmd_show: int) -> bool:
         """창 표시 상태를 변경"""
         try:
-            result = win32gui.ShowWindow(hwnd, cmd_show)
+            win32gui.ShowWindow(hwnd, cmd_show)
             return True
         except Exception as e:
             self.logger.error(f"창 표시 상태 변경 실패 (hwnd: {hwnd}): {str(e)}")
@@ -268,4 +481,215 @@ class WindowsAPIWrapper:
             return win32gui.GetForegroundWindow()
         except Exception as e:
             self.logger.error(f"포어그라운드 창 가져오기 실패: {str(e)}")
-            return 0
\ No newline at end of file
+            return 0
+
+
+class VirtualDesktopManager:
+    """IVirtualDesktopManager 래퍼 (COM 객체는 호출 스레드별로 한 번만 생성)"""
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._local = threading.local()
+
+    def _manager(self):
+        """현재 스레드의 COM 객체 반환 (생성 실패 시 None)"""
+        vdm = getattr(self._local, 'vdm', None)
+        if vdm is not None or not HAVE_COMTYPES or getattr(self._local, 'failed', False):
+            return vdm
+
+        try:
+            try:
+                comtypes.CoInitialize()
+            except OSError:
+                pass  # 이미 다른 모드로 초기화된 스레드
+
+            vdm = comtypes.CoCreateInstance(CLSID_VirtualDesktopManager,
+                                            interface=IVirtualDesktopManager)
+            self._local.vdm = vdm
+        except Exception as e:
+            self._local.failed = True
+            self.logger.warning(f"가상 데스크톱 관리자 생성 실패: {str(e)}")
+
+        return vdm
+
+    def get_window_desktop_id(self, hwnd: int) -> Optional[str]:
+        """창이 속한 가상 데스크톱 GUID 문자열 반환 (알 수 없으면 None)"""
+        vdm = self._manager()
+        if vdm is None or not hwnd:
+            return None
+
+        try:
+            desktop_id = vdm.GetWindowDesktopId(hwnd)
+        except Exception as e:
+            self.logger.debug(f"창 데스크톱 ID 조회 실패 (hwnd: {hwnd}): {str(e)}")
+            return None
+
+        # 모든 데스크톱에 표시되는 창(작업 표시줄 등)은 빈 GUID
+        return str(desktop_id) if desktop_id != GUID() else None
+
+    def is_window_on_current_desktop(self, hwnd: int) -> Optional[bool]:
+        """창이 현재 가상 데스크톱에 있는지 반환 (알 수 없으면 None)"""
+        vdm = self._manager()
+        if vdm is None or not hwnd:
+            return None
+
+        try:
+            return bool(vdm.IsWindowOnCurrentVirtualDesktop(hwnd))
+        except Exception as e:
+            self.logger.debug(f"현재 데스크톱 여부 조회 실패 (hwnd: {hwnd}): {str(e)}")
+            return None
+
+
+class WinEventHook:
+    """SetWinEventHook 래퍼 - 전용 스레드의 메시지 루프에서 창 단위 이벤트 콜백 호출
+
+    이벤트마다 범위가 한 이벤트뿐인 후크를 따로 등록해 필요 없는 이벤트는 받지 않음
+    """
+
+    def __init__(self, events: Tuple[int, ...], callback: Callable[[int, int], None],
+                 name: str = "WinEventHook"):
+        self.logger = logging.getLogger(__name__)
+        self._events = events
+        self._callback = callback
+        self._name = name
+        self._thread: Optional[threading.Thread] = None
+        self._thread_id = 0
+        self._proc = None  # ctypes 콜백 참조 유지 (GC 방지)
+        self._ready = threading.Event()
+        self._running = False
+
+    def start(self) -> bool:
+        """후크 스레드 시작 (후크 등록 결과 반환)"""
+        if self._running:
+            return True
+
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        self._ready.wait(1.0)
+        return self._running
+
+    def stop(self) -> None:
+        """메시지 루프 종료 후 후크 해제"""
+        if self._thread_id:
+            ctypes.windll.user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """후크 동작 여부 반환"""
+        return self._running
+
+    def _on_event(self, hook, event, hwnd, id_object, id_child, thread_id, event_time) -> None:
+        """WinEvent 콜백 - 창 자체에 대한 이벤트만 전달"""
+        if id_object != OBJID_WINDOW or id_child != CHILDID_SELF or not hwnd:
+            return
+        try:
+            self._callback(event, hwnd)
+        except Exception as e:
+            self.logger.error(f"WinEvent 콜백 실행 중 오류: {str(e)}")
+
+    def _run(self) -> None:
+        """후크 등록 및 메시지 루프 (후크 콜백은 이 스레드에서 호출됨)"""
+        user32 = ctypes.windll.user32
+        user32.SetWinEventHook.restype = wintypes.HANDLE
+        user32.SetWinEventHook.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE,
+                                           WinEventProcType, wintypes.DWORD, wintypes.DWORD,
+                                           wintypes.DWORD)
+        user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+
+        self._proc = WinEventProcType(self._on_event)
+        hooks = []
+        for event in self._events:
+            hook = user32.SetWinEventHook(event, event, None, self._proc, 0, 0,
+                                          WINEVENT_OUTOFCONTEXT | WINEVENT_SKIPOWNPROCESS)
+            if not hook:
+                self.logger.warning(f"WinEvent 후크 등록 실패: {self._name} (event: {event:#06x})")
+                for registered in hooks:
+                    user32.UnhookWinEvent(registered)
+                self._ready.set()
+                return
+            hooks.append(hook)
+
+        self._thread_id = ctypes.windll.kernel32.GetCurrentThreadId()
+        self._running = True
+        self._ready.set()
+
+        try:
+            msg = wintypes.MSG()
+            while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+                user32.TranslateMessage(ctypes.byref(msg))
+                user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            for hook in hooks:
+                user32.UnhookWinEvent(hook)
+            self._running = False
+            self._thread_id = 0
+
+
+class DisplayChangeListener:
+    """숨김 최상위 창으로 디스플레이 구성 변경 메시지를 받아 콜백 호출 (전용 스레드)"""
+
+    def __init__(self, callback: Callable[[], None], name: str = "DisplayChangeListener"):
+        self.logger = logging.getLogger(__name__)
+        self._callback = callback
+        self._name = name
+        self._thread: Optional[threading.Thread] = None
+        self._hwnd = 0
+        self._ready = threading.Event()
+
+    def start(self) -> bool:
+        """메시지 창 스레드 시작 (창 생성 결과 반환)"""
+        if self._hwnd:
+            return True
+
+        self._ready.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+        self._ready.wait(1.0)
+        return bool(self._hwnd)
+
+    def stop(self) -> None:
+        """메시지 창 닫기 (메시지 루프 종료)"""
+        if self._hwnd:
+            win32gui.PostMessage(self._hwnd, win32con.WM_CLOSE, 0, 0)
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def _wnd_proc(self, hwnd, msg, wparam, lparam):
+        """창 프로시저 - 디스플레이 변경 및 작업 영역 변경 시 콜백 호출"""
+        if msg == win32con.WM_DISPLAYCHANGE or (msg == win32con.WM_SETTINGCHANGE and wparam == SPI_SETWORKAREA):
+            try:
+                self._callback()
+            except Exception as e:
+                self.logger.error(f"디스플레이 변경 콜백 실행 중 오류: {str(e)}")
+            return 0
+
+        if msg == win32con.WM_DESTROY:
+            win32gui.PostQuitMessage(0)
+            return 0
+
+        return win32gui.DefWindowProc(hwnd, msg, wparam, lparam)
+
+    def _run(self) -> None:
+        """창 생성 및 메시지 루프 (브로드캐스트 메시지는 메시지 전용 창에 전달되지 않으므로 숨김 창 사용)"""
+        try:
+            wc = win32gui.WNDCLASS()
+            wc.lpfnWndProc = self._wnd_proc
+            wc.lpszClassName = f"VDMC_{self._name}_{id(self)}"
+            wc.hInstance = win32api.GetModuleHandle(None)
+            atom = win32gui.RegisterClass(wc)
+            self._hwnd = win32gui.CreateWindow(atom, self._name, 0, 0, 0, 0, 0, 0, 0, wc.hInstance, None)
+        except Exception as e:
+            self.logger.warning(f"디스플레이 변경 감지 창 생성 실패: {str(e)}")
+            self._ready.set()
+            return
+
+        self._ready.set()
+        try:
+            win32gui.PumpMessages()
+        finally:
+            self._hwnd = 0
+            win32gui.UnregisterClass(atom, wc.hInstance)
\ No newline at end of file
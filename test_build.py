@@ -2,7 +2,6 @@
 """
 빌드된 실행 파일 테스트 및 최적화 스크립트
 """
-import os
 import sys
 import time
 import subprocess
@@ -10,17 +9,19 @@ from pathlib import Path
 
 
 def check_build_exists():
-    """빌드된 실행 파일 존재 확인"""
+    """빌드된 실행 파일 존재 확인 (실행 파일 경로와 stat 결과 반환)"""
     exe_path = Path('dist/VirtualDesktopMonitorControl.exe')
-    if exe_path.exists():
-        size_mb = exe_path.stat().st_size / (1024 * 1024)
-        print(f"실행 파일 발견: {exe_path}")
-        print(f"파일 크기: {size_mb:.2f} MB")
-        return exe_path
-    else:
+    try:
+        exe_stat = exe_path.stat()
+    except FileNotFoundError:
         print("실행 파일을 찾을 수 없습니다.")
         print("먼저 build.py를 실행하여 빌드를 완료하세요.")
-        return None
+        return None, None
+
+    size_mb = exe_stat.st_size / (1024 * 1024)
+    print(f"실행 파일 발견: {exe_path}")
+    print(f"파일 크기: {size_mb:.2f} MB")
+    return exe_path, exe_stat
 
 
 def test_executable_startup(exe_path):
@@ -33,11 +34,10 @@ def test_executable_startup(exe_path):
                                  stdout=subprocess.PIPE,
                                  stderr=subprocess.PIPE)
 
-        # 3초 대기
-        time.sleep(3)
-
-        # 프로세스가 여전히 실행 중인지 확인
-        if process.poll() is None:
+        # 최대 3초 동안 종료 여부 확인 (그 전에 종료되면 바로 실패 처리)
+        try:
+            returncode = process.wait(timeout=3)
+        except subprocess.TimeoutExpired:
             print("✓ 실행 파일이 성공적으로 시작되었습니다.")
 
             # 프로세스 종료
@@ -45,19 +45,19 @@ def test_executable_startup(exe_path):
             process.wait(timeout=5)
             print("✓ 실행 파일이 정상적으로 종료되었습니다.")
             return True
-        else:
-            stdout, stderr = process.communicate()
-            print("✗ 실행 파일이 즉시 종료되었습니다.")
-            if stderr:
-                print(f"오류: {stderr.decode('utf-8', errors='ignore')}")
-            return False
+
+        stdout, stderr = process.communicate()
+        print(f"✗ 실행 파일이 즉시 종료되었습니다. (종료 코드: {returncode})")
+        if stderr:
+            print(f"오류: {stderr.decode('utf-8', errors='ignore')}")
+        return False
 
     except Exception as e:
         print(f"✗ 실행 파일 테스트 중 오류: {e}")
         return False
 
 
-def analyze_dependencies(exe_path):
+def analyze_dependencies(exe_stat):
     """실행 파일 의존성 분석"""
     print("\n실행 파일 의존성 분석...")
 
@@ -73,7 +73,7 @@ def analyze_dependencies(exe_path):
             print("- PyInstaller 분석 도구 사용 불가")
 
         # 파일 크기 분석
-        size_mb = exe_path.stat().st_size / (1024 * 1024)
+        size_mb = exe_stat.st_size / (1024 * 1024)
 
         if size_mb > 100:
             print(f"⚠ 파일 크기가 큽니다: {size_mb:.2f} MB")
@@ -125,15 +125,11 @@ def check_required_files():
     return all_good
 
 
-def create_optimization_report():
+def create_optimization_report(exe_stat):
     """최적화 보고서 생성"""
     print("\n최적화 보고서 생성...")
 
-    exe_path = Path('dist/VirtualDesktopMonitorControl.exe')
-    if not exe_path.exists():
-        return False
-
-    size_mb = exe_path.stat().st_size / (1024 * 1024)
+    size_mb = exe_stat.st_size / (1024 * 1024)
 
     report = f"""# 빌드 최적화 보고서
 
@@ -189,7 +185,7 @@ def main():
 
     # 1. 빌드 파일 존재 확인
     print("1. 빌드된 실행 파일 확인...")
-    exe_path = check_build_exists()
+    exe_path, exe_stat = check_build_exists()
     if not exe_path:
         return 1
 
@@ -204,11 +200,11 @@ def main():
 
     # 4. 의존성 분석
     print("\n4. 의존성 분석...")
-    analyze_dependencies(exe_path)
+    analyze_dependencies(exe_stat)
 
     # 5. 최적화 보고서 생성
     print("\n5. 최적화 보고서 생성...")
-    create_optimization_report()
+    create_optimization_report(exe_stat)
 
     print("\n=== 테스트 완료 ===")
 